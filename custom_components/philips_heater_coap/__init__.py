@@ -4,64 +4,222 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections.abc import Callable, Iterable
+import random
 import time
 from typing import Any
 
 from aioairctrl import CoAPClient
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST, Platform
-from homeassistant.core import HomeAssistant, callback
-from homeassistant.exceptions import ConfigEntryNotReady
-from homeassistant.helpers.storage import Store
+from homeassistant.const import CONF_HOST, EVENT_HOMEASSISTANT_STOP, Platform
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.start import async_at_started
+from homeassistant.helpers.typing import ConfigType
 import homeassistant.helpers.entity_registry as er
 
-from .const import DOMAIN, PhilipsApi
+from .commands import (
+    COMMAND_DEADLINE,
+    COMMAND_DISCONNECTED,
+    COMMAND_FAILED,
+    COMMAND_TIMEOUT,
+    CommandError,
+    CommandQueue,
+)
+from .const import (
+    DATA_DISCOVERY,
+    DATA_FLEET,
+    DOMAIN,
+    MAX_TEMP,
+    MIN_TEMP,
+    OPTIONS_KEY,
+    OSCILLATION_ON,
+    OSCILLATION_STATUS,
+    PhilipsApi,
+)
+from .discovery import HeaterDiscovery, async_request_discovery
+from .energy import ENERGY_KEY, HeatingIntegrator, heating_power
+from .fleet import async_setup_fleet
+from .handoff import HandoffSession, async_get_handoff
+from .history import StatusHistory
+from .metrics import HeaterMetrics, HeaterMetricsView
+from .preheat import PreheatScheduler, async_setup_services
+from .state import HeaterState
+from .stats import IntervalStats
+from .storage import CoalescingStore, StatusStore
+from .thermal import (
+    BOOST_MAX_DURATION,
+    AutoPlusPlan,
+    ThermalModel,
+    plan_auto_plus,
+    thermal_regime,
+)
+from .transport import (
+    SharedCoAPTransport,
+    async_acquire_transport,
+    async_release_transport,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
 PLATFORMS = [Platform.CLIMATE, Platform.SELECT, Platform.NUMBER, Platform.SENSOR]
-STORAGE_VERSION = 1
+STORAGE_VERSION = 2
+LEARNED_STORAGE_VERSION = 1
 STORAGE_KEY = "philips_heater_coap"
-WATCHDOG_TIMEOUT = 86400  # seconds without update before reconnecting
+STORAGE_SAVE_DELAY = 300  # max seconds a changed status may go unpersisted
+LEARNED_SAVE_DELAY = 3600  # max seconds learned device behaviour may go unpersisted
+ENERGY_SAVE_DELAY = 300  # max seconds accumulated energy may go unpersisted
+BOOST_SAVE_DELAY = 10  # max seconds a started or ended Auto+ boost may go unpersisted
+WATCHDOG_TIMEOUT = 86400  # seconds without update before reconnecting (until cadence is learned)
+WATCHDOG_MIN_TIMEOUT = 120  # floor for the learned watchdog timeout
+WATCHDOG_P99_MULTIPLIER = 3  # learned timeout is this multiple of the P99 interval
+WATCHDOG_MIN_SAMPLES = 30  # intervals needed before the learned timeout is used
 RECONNECT_DELAY_INITIAL = 30  # seconds before first reconnect attempt
 RECONNECT_DELAY_MAX = 3600  # max seconds between reconnect attempts (1 hour)
+CONNECT_TIMEOUT = 30  # seconds allowed for a handshake once it has a slot
+RECOVERY_REOBSERVE_DELAY = 0.5  # seconds before re-issuing observe on the same session
+RECOVERY_RESYNC_DELAY = 5  # seconds before re-syncing the session's encryption keys
+RECOVERY_RESYNC_TIMEOUT = 10  # seconds allowed for a session re-sync
+OPTIMISTIC_CONFIRM_TIMEOUT = 15  # seconds for the device to confirm a write
+COMMAND_RETRY_DELAY = 1  # seconds before resending a write that failed
+COMMAND_RECONNECT_INTERVAL = 2  # max seconds between connect attempts while a write waits
+
+# Written values the device reports back as a different value once applied
+REPORTED_AS = {PhilipsApi.OSCILLATION: {OSCILLATION_ON: OSCILLATION_STATUS}}
+
+
+def confirms_write(key: str, written: Any, reported: Any) -> bool:
+    """Return True if the device reporting reported for key confirms written."""
+    return reported == written or reported == REPORTED_AS.get(key, {}).get(written, written)
 
 
 class HeaterObserveCoordinator:
     """Coordinator for Philips Heater using CoAP observe (push updates)."""
 
-    def __init__(self, hass: HomeAssistant, host: str, entry_id: str) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        host: str,
+        entry_id: str,
+        transport: SharedCoAPTransport,
+        save_delay: float = STORAGE_SAVE_DELAY,
+    ) -> None:
         """Initialize coordinator."""
         self.hass = hass
         self.host = host
+        # status is the device-reported state with any unconfirmed writes overlaid
         self.status: dict[str, Any] = {}
+        self._device_status: dict[str, Any] = {}
+        self._optimistic: dict[str, Any] = {}
+        self._optimistic_deadlines: dict[str, float] = {}  # monotonic, per field
+        self._optimistic_unsub: CALLBACK_TYPE | None = None
+        # status decoded once per change for all entities to read
+        self.state = HeaterState.from_status(self.status)
         self.client: CoAPClient | None = None
-        self._listeners: list = []
+        self._connected = asyncio.Event()  # set while client is not None
+        self._reconnect_now = asyncio.Event()  # cuts a reconnect backoff short
+        self._waiting_commands = 0  # writes waiting for a session
+        self._transport = transport
+        self._listeners: list[tuple[Callable[[], None], frozenset[str] | None]] = []
         self._task: asyncio.Task | None = None
-        self._store = Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}.{entry_id}")
+        self._commands = CommandQueue(hass, host, self._async_write_control_values)
+        self._store = StatusStore(
+            hass,
+            STORAGE_VERSION,
+            f"{STORAGE_KEY}.{entry_id}",
+            lambda: {"status": self._device_status, "saved_at": time.time()},
+            save_delay,
+        )
+        # Wall time of the last push; recently healthy heaters reconnect first
+        self.last_healthy: float | None = None
+        # True until the first live push replaces the cached status
+        self.restored = False
+        self.restored_saved_at: float | None = None
+        # Behaviour learned over the device's lifetime, kept across restarts
+        self._learned_store = CoalescingStore(
+            hass,
+            LEARNED_STORAGE_VERSION,
+            f"{STORAGE_KEY}.{entry_id}.learned",
+            self._learned_data,
+            LEARNED_SAVE_DELAY,
+        )
+        self._cadence = IntervalStats()
         # Observe frequency stats
         self._connected_at: float | None = None
         self._last_update_at: float | None = None
-        self._longest_wait: float = 0.0
-        self._update_intervals: list[float] = []
-
-    async def async_start(self) -> None:
-        """Load cached state, create CoAP client, and start observing."""
-        self.status = await self._store.async_load() or {}
-        try:
-            self.client = await asyncio.wait_for(
-                CoAPClient.create(self.host), timeout=15
+        self._interval_stats = IntervalStats()
+        self.metrics = HeaterMetrics()
+        # Recent device-reported temperature and heating state for local analytics
+        self.history = StatusHistory()
+        # Heating time and estimated energy, learned across restarts
+        self.energy = HeatingIntegrator()
+        self._energy_published: tuple | None = None
+        # Room heating/cooling rates, learned across restarts
+        self.thermal = ThermalModel()
+        # Active Auto+ boost on High and the timer that ends it
+        self._boost: AutoPlusPlan | None = None
+        self._boost_deadline: float | None = None  # wall time, survives restarts
+        self._boost_unsub: CALLBACK_TYPE | None = None
+        # Scheduled pre-heat targets
+        self.preheat = PreheatScheduler(hass, self, entry_id)
+
+    async def async_start(self, handoff: HandoffSession | None = None) -> None:
+        """Load cached state and start connecting and observing in the background.
+
+        Returns without waiting for the device, so entities come up at once
+        with the cached status and become available when a session exists.
+        A session handed over by the config flow is adopted as is, skipping
+        the handshake and starting from the status it returned.
+        """
+        cached = await self._store.async_load() or {}
+        self._device_status = cached.get("status") or {}
+        self.status = self._device_status
+        self.state = HeaterState.from_status(self.status)
+        self.restored = bool(self._device_status)
+        self.restored_saved_at = cached.get("saved_at")
+        learned = await self._learned_store.async_load() or {}
+        if cadence := learned.get("cadence"):
+            self._cadence = IntervalStats.from_dict(cadence)
+        if energy := learned.get("energy"):
+            self.energy = HeatingIntegrator.from_dict(energy)
+        if thermal := learned.get("thermal"):
+            self.thermal = ThermalModel.from_dict(thermal)
+        self.last_healthy = learned.get("last_healthy")
+        if boost := learned.get("boost"):
+            # A boost survives reloads; its handover and time cap still apply
+            self._async_arm_boost(
+                AutoPlusPlan(boost["target"], True, boost["handover_temperature"], None),
+                boost["deadline"],
             )
-        except Exception as err:
-            raise ConfigEntryNotReady(f"Cannot connect to {self.host}") from err
-        self._connected_at = time.monotonic()
+        if handoff is not None:
+            _LOGGER.info("Adopting config flow session for %s", self.host)
+            self.client = handoff.client
+            self._connected.set()
+            self._connected_at = time.monotonic()
+            self.last_healthy = time.time()
+            self._device_status = handoff.status
+            self.status = self._device_status
+            self.state = HeaterState.from_status(self.status)
+            self.restored = False
+            self._store.async_schedule_save()
         self._task = asyncio.create_task(self._async_observe_status())
+        await self.preheat.async_load()
 
     async def shutdown(self) -> None:
         """Shutdown the connection."""
         if self._task:
             self._task.cancel()
+        await self._commands.async_shutdown()
+        self._async_cancel_optimistic_timeout()
+        # Keep a running boost's plan; it is saved below and re-armed on setup
+        self._async_cancel_boost_timer()
+        await self.preheat.async_shutdown()
+        await self._store.async_flush()
+        await self._learned_store.async_flush()
         if self.client:
             try:
                 await self.client.shutdown()
@@ -69,104 +227,590 @@ class HeaterObserveCoordinator:
                 # Ignore shutdown errors (aiocoap can have race conditions during cleanup)
                 _LOGGER.debug("Error during client shutdown (expected): %s", err)
 
+    async def async_set_control_values(
+        self, values: dict[str, Any], timeout: float = COMMAND_DEADLINE
+    ) -> None:
+        """Write control values, merged with other writes issued close together.
+
+        Waits up to timeout for the device to acknowledge, including any
+        reconnect in progress. Raises CommandError if it does not.
+        """
+        # Any other command supersedes a running Auto+ boost
+        self._async_cancel_boost()
+        await self._commands.async_submit(values, timeout)
+
+    async def async_start_auto_plus(self, offset: int) -> None:
+        """Heat to offset above the current temperature as fast as is worthwhile."""
+        current = self.state.current_temperature
+        if current is None:
+            # Fallback to regular auto if no current temperature
+            await self.async_set_control_values(
+                {PhilipsApi.OPERATING_MODE: 0, PhilipsApi.POWER: 1}
+            )
+            return
+
+        await self.async_heat_to(max(MIN_TEMP, min(int(current) + offset, MAX_TEMP)))
+
+    async def async_heat_to(self, target: int) -> None:
+        """Heat to target in Auto, boosting on High first if that is worthwhile.
+
+        The learned room model decides whether to boost on High until just
+        below the target and then hand over to Auto, or to use Auto alone.
+        """
+        current = self.state.current_temperature
+        if current is None:
+            await self.async_set_control_values(
+                {PhilipsApi.OPERATING_MODE: 0, PhilipsApi.TARGET_TEMP: target, PhilipsApi.POWER: 1}
+            )
+            return
+
+        plan = plan_auto_plus(self.thermal, current, target)
+        _LOGGER.debug("Auto+ plan for %s from %.1f°C: %s", self.host, current, plan)
+        await self.async_set_control_values(
+            {
+                PhilipsApi.OPERATING_MODE: 65 if plan.boost else 0,
+                PhilipsApi.TARGET_TEMP: target,
+                PhilipsApi.POWER: 1,
+            }
+        )
+        if plan.boost:
+            self._async_arm_boost(plan, time.time() + BOOST_MAX_DURATION)
+            self._learned_store.async_schedule_save(BOOST_SAVE_DELAY)
+
+    @callback
+    def _async_arm_boost(self, plan: AutoPlusPlan, deadline: float) -> None:
+        """Track a boost and hand over at its deadline at the latest."""
+        self._boost = plan
+        self._boost_deadline = deadline
+        self._boost_unsub = async_call_later(
+            self.hass, max(0.0, deadline - time.time()), self._async_boost_timeout
+        )
+
+    @callback
+    def _async_check_boost(self) -> None:
+        """Hand a boost over to Auto once the room is close to the target."""
+        if (plan := self._boost) is None:
+            return
+        state = self.state
+        if not state.is_on or state.operating_mode != 65:
+            # Changed on the device itself; leave it alone
+            _LOGGER.debug("Auto+ boost on %s superseded on the device", self.host)
+            self._async_cancel_boost()
+            return
+        if (
+            state.current_temperature is not None
+            and state.current_temperature >= plan.handover_temperature
+        ) or time.time() >= self._boost_deadline:
+            self._async_end_boost()
+
+    @callback
+    def _async_boost_timeout(self, _now: Any) -> None:
+        """Hand over to Auto when a boost runs longer than allowed."""
+        self._boost_unsub = None
+        if self._boost is not None and self.client is not None:
+            # Without a session the first push ends the boost instead
+            _LOGGER.info("Auto+ boost on %s hit its time limit", self.host)
+            self._async_end_boost()
+
+    @callback
+    def _async_end_boost(self) -> None:
+        """Switch from the High boost to Auto at the planned target."""
+        target = self._boost.target
+        self._async_cancel_boost()
+        _LOGGER.info("Auto+ on %s handing over from High to Auto", self.host)
+        self.hass.async_create_task(self._async_hand_over(target))
+
+    async def _async_hand_over(self, target: int) -> None:
+        """Send the boost's handover to Auto, logging a failure."""
+        try:
+            await self.async_set_control_values(
+                {PhilipsApi.OPERATING_MODE: 0, PhilipsApi.TARGET_TEMP: target}
+            )
+        except CommandError as err:
+            _LOGGER.warning("Auto+ handover to Auto on %s failed: %s", self.host, err)
+
     @callback
-    def async_add_listener(self, update_callback) -> callable:
-        """Add listener for updates."""
-        self._listeners.append(update_callback)
+    def _async_cancel_boost(self) -> None:
+        """Forget any running boost."""
+        if self._boost is not None:
+            self._boost = None
+            self._boost_deadline = None
+            self._learned_store.async_schedule_save(BOOST_SAVE_DELAY)
+        self._async_cancel_boost_timer()
+
+    @callback
+    def _async_cancel_boost_timer(self) -> None:
+        """Stop the boost's time cap without forgetting the boost."""
+        if self._boost_unsub:
+            self._boost_unsub()
+            self._boost_unsub = None
+
+    async def _async_write_control_values(
+        self, values: dict[str, Any], deadline: float
+    ) -> None:
+        """Send one merged batch of control values to the device by deadline.
+
+        Control writes set absolute field values, so a failed write is
+        resent once; the retry goes out on whichever session is current.
+        """
+        metrics = self.metrics
+        try:
+            async with asyncio.timeout_at(deadline):
+                try:
+                    await self._async_send_control_values(values)
+                except Exception as err:
+                    _LOGGER.debug("Write to %s failed: %s, retrying", self.host, err)
+                    metrics.command_retries += 1
+                    await asyncio.sleep(COMMAND_RETRY_DELAY)
+                    await self._async_send_control_values(values)
+        except asyncio.TimeoutError as err:
+            reason = COMMAND_TIMEOUT if self.client is not None else COMMAND_DISCONNECTED
+            metrics.command_failures[reason] += 1
+            _LOGGER.warning("Write of %s to %s failed: %s", values, self.host, reason)
+            raise CommandError(self.host, values, reason) from err
+        except Exception as err:
+            metrics.command_failures[COMMAND_FAILED] += 1
+            _LOGGER.warning("Write of %s to %s failed: %s", values, self.host, err)
+            raise CommandError(self.host, values, COMMAND_FAILED) from err
+        self._async_apply_optimistic(values)
+
+    async def _async_send_control_values(self, values: dict[str, Any]) -> None:
+        """Send values on the current session, waiting for one if needed."""
+        while (client := self.client) is None:
+            # Don't sit out the backoff while a command is waiting
+            self._waiting_commands += 1
+            self._reconnect_now.set()
+            try:
+                await self._connected.wait()
+            finally:
+                self._waiting_commands -= 1
+        metrics = self.metrics
+        metrics.commands += 1
+        start = time.perf_counter()
+        await client.set_control_values(values)
+        metrics.command_latency.observe(time.perf_counter() - start)
+
+    @property
+    def available(self) -> bool:
+        """Return True while a live session exists or cached status is shown.
+
+        Restored status keeps entities available from startup until the
+        first live push; after that they follow the session.
+        """
+        return self.client is not None or self.restored
+
+    @property
+    def boosting(self) -> bool:
+        """Return True while an Auto+ boost runs High on the way to Auto."""
+        return self._boost is not None
+
+    @property
+    def restored_age(self) -> float | None:
+        """Return the age in seconds of restored status, if still shown."""
+        if not self.restored or self.restored_saved_at is None:
+            return None
+        return max(0.0, time.time() - self.restored_saved_at)
+
+    @property
+    def pending_keys(self) -> set[str]:
+        """Return fields written but not yet confirmed by the device."""
+        return set(self._optimistic)
+
+    @callback
+    def _async_apply_optimistic(self, values: dict[str, Any]) -> None:
+        """Show acknowledged writes immediately, pending device confirmation.
+
+        The device's control push can arrive before the write's ack; values
+        it already reports need no overlay and replace any older pending one.
+        """
+        deadline = time.monotonic() + OPTIMISTIC_CONFIRM_TIMEOUT
+        for key, value in values.items():
+            if confirms_write(key, value, self._device_status.get(key)):
+                self._optimistic.pop(key, None)
+                self._optimistic_deadlines.pop(key, None)
+            else:
+                self._optimistic[key] = value
+                self._optimistic_deadlines[key] = deadline
+        self._async_schedule_optimistic_timeout()
+        self._async_update_status()
+
+    @callback
+    def _async_reconcile_optimistic(self, status: dict[str, Any]) -> None:
+        """Drop the overlay for each field the device now reports as written.
+
+        Fields it reports differently stay pending until their own timeout,
+        since the push may predate a write issued after it.
+        """
+        for key, expected in list(self._optimistic.items()):
+            if confirms_write(key, expected, status.get(key)):
+                del self._optimistic[key]
+                del self._optimistic_deadlines[key]
+        self._async_schedule_optimistic_timeout()
+
+    @callback
+    def _async_optimistic_timeout(self, _now: Any) -> None:
+        """Roll back writes the device never confirmed.
+
+        A field the device reports as written by now (say its control push
+        was missed but a heartbeat carries the value) is dropped quietly.
+        """
+        self._optimistic_unsub = None
+        now = time.monotonic()
+        expired = {
+            key: self._optimistic.pop(key)
+            for key, deadline in list(self._optimistic_deadlines.items())
+            if deadline <= now
+        }
+        for key in expired:
+            del self._optimistic_deadlines[key]
+        unconfirmed = {
+            key: value
+            for key, value in expired.items()
+            if not confirms_write(key, value, self._device_status.get(key))
+        }
+        if unconfirmed:
+            _LOGGER.warning(
+                "%s did not confirm %s within %ds, using device value",
+                self.host, unconfirmed, OPTIMISTIC_CONFIRM_TIMEOUT,
+            )
+        if expired:
+            self._async_update_status()
+        self._async_schedule_optimistic_timeout()
+
+    @callback
+    def _async_schedule_optimistic_timeout(self) -> None:
+        """Arm the timer for the earliest pending field's deadline."""
+        self._async_cancel_optimistic_timeout()
+        if self._optimistic_deadlines:
+            delay = min(self._optimistic_deadlines.values()) - time.monotonic()
+            self._optimistic_unsub = async_call_later(
+                self.hass, max(0.0, delay), self._async_optimistic_timeout
+            )
+
+    @callback
+    def _async_cancel_optimistic_timeout(self) -> None:
+        """Cancel the pending confirmation timeout."""
+        if self._optimistic_unsub:
+            self._optimistic_unsub()
+            self._optimistic_unsub = None
+
+    @callback
+    def _async_update_status(self) -> dict[str, Any]:
+        """Rebuild status from the device state and overlay, notifying on changes."""
+        if self._optimistic:
+            status = {**self._device_status, **self._optimistic}
+        else:
+            status = self._device_status
+        changes = {k: v for k, v in status.items() if self.status.get(k) != v}
+        self.status = status
+        if changes.keys() - {PhilipsApi.STATUS_TYPE}:
+            self.state = HeaterState.from_status(status)
+        self._async_notify_listeners(changes)
+        return changes
+
+    @callback
+    def _learned_data(self) -> dict[str, Any]:
+        """Return learned device behaviour to persist."""
+        return {
+            "cadence": self._cadence.as_dict(),
+            "energy": self.energy.as_dict(),
+            "thermal": self.thermal.as_dict(),
+            "last_healthy": self.last_healthy,
+            "boost": (
+                {
+                    "target": plan.target,
+                    "handover_temperature": plan.handover_temperature,
+                    "deadline": self._boost_deadline,
+                }
+                if (plan := self._boost) is not None
+                else None
+            ),
+        }
+
+    @property
+    def watchdog_timeout(self) -> float:
+        """Return seconds without an update before the observe is considered dead.
+
+        Derived from the device's learned heartbeat cadence once enough
+        intervals have been seen, falling back to WATCHDOG_TIMEOUT before that.
+        """
+        cadence = self._cadence
+        if cadence.count < WATCHDOG_MIN_SAMPLES or (p99 := cadence.quantile(0.99)) is None:
+            return WATCHDOG_TIMEOUT
+        return min(
+            WATCHDOG_TIMEOUT, max(WATCHDOG_MIN_TIMEOUT, p99 * WATCHDOG_P99_MULTIPLIER)
+        )
+
+    @callback
+    def async_options_updated(self) -> None:
+        """Tell listeners that entry options changed."""
+        self._async_notify_listeners({OPTIONS_KEY: None})
+
+    @callback
+    def async_diagnostics(self) -> dict[str, Any]:
+        """Return connection statistics and history for diagnostics."""
+        return {
+            "restored": self.restored,
+            "restored_age": self.restored_age,
+            "pending_keys": sorted(self._optimistic),
+            "watchdog_timeout": self.watchdog_timeout,
+            "observe_intervals": self._interval_stats.as_dict(),
+            "learned_cadence": self._cadence.as_dict(),
+            "thermal": self.thermal.as_dict(),
+            "auto_plus_boost": repr(self._boost) if self._boost else None,
+            "preheat_targets": [repr(target) for target in self.preheat.targets],
+            "preheat_next_start": self.preheat.next_start,
+            "history": self.history.as_dict(),
+        }
+
+    @property
+    def storage_saves(self) -> int:
+        """Return cached status and learned data writes since start."""
+        return self._store.saves + self._learned_store.saves
+
+    @callback
+    def async_metric_gauges(self) -> dict[str, tuple[str, float | None]]:
+        """Return current gauge values (metric name -> help text, value)."""
+        now = time.monotonic()
+        stats = self._interval_stats
+        return {
+            "connected": ("Whether a client session exists.", int(self.client is not None)),
+            "connection_age_seconds": (
+                "Seconds since the client connected.",
+                now - self._connected_at if self._connected_at is not None else None,
+            ),
+            "last_push_age_seconds": (
+                "Seconds since the last observe push.",
+                now - self._last_update_at if self._last_update_at is not None else None,
+            ),
+            "push_interval_mean_seconds": (
+                "Mean observe push interval this connection.",
+                stats.mean if stats.count else None,
+            ),
+            "push_interval_p95_seconds": (
+                "Estimated P95 observe push interval this connection.",
+                stats.quantile(0.95),
+            ),
+            "push_interval_longest_seconds": (
+                "Longest observe push interval this connection.",
+                stats.longest if stats.count else None,
+            ),
+            "watchdog_timeout_seconds": (
+                "Seconds without a push before the observe is rebuilt.",
+                self.watchdog_timeout,
+            ),
+            "pending_writes": ("Writes awaiting device confirmation.", len(self._optimistic)),
+            "energy_kwh": ("Estimated energy used.", self.energy.energy_kwh),
+        }
+
+    @callback
+    def async_add_listener(
+        self, update_callback: Callable[[], None], keys: Iterable[str] | None = None
+    ) -> Callable[[], None]:
+        """Add listener for updates.
+
+        When keys is given the listener is only called when one of those
+        status fields changes; otherwise it is called for any change.
+        """
+        listener = (update_callback, frozenset(keys) if keys is not None else None)
+        self._listeners.append(listener)
 
         @callback
         def remove_listener() -> None:
-            self._listeners.remove(update_callback)
+            self._listeners.remove(listener)
 
         return remove_listener
 
+    @callback
+    def _async_notify_listeners(self, changes: dict[str, Any]) -> None:
+        """Call the listeners that depend on any of the changed fields."""
+        changed = changes.keys() - {PhilipsApi.STATUS_TYPE}
+        if not changed:
+            return
+        self._async_dispatch(changed)
+
+    @callback
+    def _async_notify_all(self) -> None:
+        """Call every listener, e.g. when availability changes."""
+        self._async_dispatch(None)
+
+    @callback
+    def _async_dispatch(self, changed: set[str] | None) -> None:
+        """Call the listeners for changed fields (None = all listeners)."""
+        start = time.perf_counter()
+        for update_callback, keys in list(self._listeners):
+            if changed is None or keys is None or not keys.isdisjoint(changed):
+                update_callback()
+        self.metrics.dispatch_time.observe(time.perf_counter() - start)
+
+    @callback
+    def _async_handle_status(self, status: dict[str, Any]) -> None:
+        """Process one status push from the device."""
+        status_type = status.get(PhilipsApi.STATUS_TYPE, "unknown")
+        self.metrics.pushes[status_type] += 1
+        previous, self._device_status = self._device_status, status
+        if self._optimistic and status_type == "control":
+            self._async_reconcile_optimistic(status)
+        changes = self._async_update_status()
+        if self.restored:
+            # Live status now; entities drop their restored marker
+            self.restored = False
+            self._async_notify_all()
+        self.last_healthy = time.time()
+        self.history.append(self.last_healthy, status)
+
+        now = time.monotonic()
+        stats = self._interval_stats
+        if self._last_update_at is not None:
+            interval = now - self._last_update_at
+            stats.add(interval)
+            self._cadence.add(interval)
+            self._learned_store.async_schedule_save()
+        self._last_update_at = now
+        self._async_update_energy(now, status)
+        temp = status.get(PhilipsApi.TEMPERATURE)
+        self.thermal.update(
+            now,
+            thermal_regime(
+                status.get(PhilipsApi.POWER),
+                status.get(PhilipsApi.OPERATING_MODE),
+                status.get(PhilipsApi.HEATING_STATUS),
+            ),
+            temp / 10 if temp is not None else None,  # Device returns temp * 10
+            self.watchdog_timeout,
+        )
+        self._async_check_boost()
+        conn_age = now - self._connected_at if self._connected_at is not None else None
+        log = _LOGGER.info if status_type == "control" else _LOGGER.debug
+        if log is _LOGGER.info or _LOGGER.isEnabledFor(logging.DEBUG):
+            p95 = stats.quantile(0.95)
+            log(
+                "Observe [%s] from %s | changed=%s conn_age=%.0fs"
+                " last_interval=%s avg_interval=%s p95_interval=%s longest_wait=%.1fs",
+                status_type,
+                self.host,
+                changes,
+                conn_age or 0,
+                f"{stats.last:.1f}s" if stats.last is not None else "n/a",
+                f"{stats.mean:.1f}s" if stats.count else "n/a",
+                f"{p95:.1f}s" if p95 is not None else "n/a",
+                stats.longest,
+            )
+
+        # Persist for restoration after restart; heartbeats only flip StatusType
+        if any(
+            k != PhilipsApi.STATUS_TYPE and previous.get(k) != v
+            for k, v in status.items()
+        ):
+            self._store.async_schedule_save()
+
+    @callback
+    def _async_update_energy(self, now: float, status: dict[str, Any]) -> None:
+        """Integrate heating time and energy up to this push."""
+        level = status.get(PhilipsApi.HEATING_STATUS)
+        watts = heating_power(
+            status.get(PhilipsApi.MODEL_ID), status.get(PhilipsApi.POWER), level
+        )
+        if not self.energy.update(now, level, watts, self.watchdog_timeout):
+            return
+        # Energy feeds a total_increasing sensor; keep a crash from losing an hour
+        self._learned_store.async_schedule_save(ENERGY_SAVE_DELAY)
+        # Only wake the energy sensors when a displayed value changes
+        energy = self.energy
+        published = (
+            round(energy.energy_kwh, 2),
+            round(energy.heating_seconds / 3600, 2),
+            round(energy.duty_cycle * 100) if energy.duty_cycle is not None else None,
+        )
+        if published != self._energy_published:
+            self._energy_published = published
+            self._async_notify_listeners({ENERGY_KEY: published})
+
+    @property
+    def connect_priority(self) -> float:
+        """Return this heater's place in the fleet handshake queue (higher first)."""
+        return self.last_healthy or 0.0
+
+    @staticmethod
+    def _next_reconnect_delay(delay: float) -> float:
+        """Return the next backoff with decorrelated jitter.
+
+        Each delay is drawn between the initial delay and three times the
+        previous one, so heaters that failed together drift apart instead
+        of retrying in lockstep.
+        """
+        return min(RECONNECT_DELAY_MAX, random.uniform(RECONNECT_DELAY_INITIAL, delay * 3))
+
     async def _async_observe_status(self) -> None:
         """Observe status updates from device with automatic reconnection."""
-        reconnect_delay = RECONNECT_DELAY_INITIAL
-        max_reconnect_delay = RECONNECT_DELAY_MAX
+        reconnect_delay: float = RECONNECT_DELAY_INITIAL  # previous backoff delay
+        recovery_tier = 0  # recovery steps taken since the last status update
 
         while True:
             # Ensure we have a valid client before attempting to observe
             if self.client is None:
                 try:
                     _LOGGER.info("Connecting to %s", self.host)
-                    self.client = await asyncio.wait_for(
-                        CoAPClient.create(self.host), timeout=30
+                    self.client = await self._transport.async_create_client(
+                        self.host, self.connect_priority, CONNECT_TIMEOUT
                     )
-                    _LOGGER.info("Connected to %s", self.host)
-                    self._connected_at = time.monotonic()
-                    self._last_update_at = None
-                    self._longest_wait = 0.0
-                    self._update_intervals = []
                 except asyncio.CancelledError:
                     raise
                 except Exception as err:
+                    self.metrics.connect_failures += 1
+                    if self.restored:
+                        # Unreachable; stop presenting the cached status as current
+                        self.restored = False
+                        self.hass.loop.call_soon(self._async_notify_all)
+                    reconnect_delay = self._next_reconnect_delay(reconnect_delay)
                     _LOGGER.error(
-                        "Failed to connect to %s: %s. Retrying in %ds...",
+                        "Failed to connect to %s: %s. Retrying in %.0fs...",
                         self.host, err, reconnect_delay,
                     )
-                    try:
-                        await asyncio.sleep(reconnect_delay)
-                    except asyncio.CancelledError:
-                        raise
-                    reconnect_delay = min(reconnect_delay * 2, max_reconnect_delay)
+                    # The heater may have a new address; discovery updates the entry
+                    self.hass.async_create_background_task(
+                        async_request_discovery(self.hass),
+                        f"philips_heater_coap discovery for {self.host}",
+                    )
+                    await self._async_backoff(reconnect_delay)
                     continue
+                _LOGGER.info("Connected to %s", self.host)
+                self._connected.set()
+                self._reconnect_now.clear()
+                self._connected_at = time.monotonic()
+                self._last_update_at = None
+                self._interval_stats.reset()
+                # Scheduled so a failing listener cannot end the observe loop
+                self.hass.loop.call_soon(self._async_notify_all)
 
             try:
                 _LOGGER.debug("Starting CoAP observe for %s", self.host)
                 observe_gen = self.client.observe_status()
                 try:
                     while True:
+                        watchdog_timeout = self.watchdog_timeout
                         try:
                             status = await asyncio.wait_for(
-                                observe_gen.__anext__(), timeout=WATCHDOG_TIMEOUT
+                                observe_gen.__anext__(), timeout=watchdog_timeout
                             )
                         except asyncio.TimeoutError:
                             _LOGGER.warning(
                                 "No status update received from %s in %ds "
                                 "(watchdog triggered), reconnecting...",
                                 self.host,
-                                WATCHDOG_TIMEOUT,
+                                watchdog_timeout,
                             )
                             break
                         except StopAsyncIteration:
                             break
-                        changes = {k: v for k, v in status.items() if self.status.get(k) != v}
-                        self.status = status
-                        now = time.monotonic()
-                        if self._last_update_at is not None:
-                            interval = now - self._last_update_at
-                            self._update_intervals.append(interval)
-                            self._longest_wait = max(self._longest_wait, interval)
-                        self._last_update_at = now
-                        avg = (
-                            sum(self._update_intervals) / len(self._update_intervals)
-                            if self._update_intervals else None
-                        )
-                        conn_age = now - self._connected_at if self._connected_at is not None else None
-                        status_type = status.get(PhilipsApi.STATUS_TYPE, "unknown")
-                        log = _LOGGER.info if status_type == "control" else _LOGGER.debug
-                        log(
-                            "Observe [%s] from %s | changed=%s conn_age=%.0fs"
-                            " last_interval=%s avg_interval=%s longest_wait=%.1fs",
-                            status_type,
-                            self.host,
-                            changes,
-                            conn_age or 0,
-                            f"{self._update_intervals[-1]:.1f}s" if self._update_intervals else "n/a",
-                            f"{avg:.1f}s" if avg is not None else "n/a",
-                            self._longest_wait,
-                        )
+                        self._async_handle_status(status)
                         reconnect_delay = RECONNECT_DELAY_INITIAL  # Reset retry delay on successful update
-                        # Save status to storage for restoration after restart
-                        await self._store.async_save(status)
-                        for update_callback in self._listeners:
-                            update_callback()
+                        recovery_tier = 0
                 finally:
                     await observe_gen.aclose()
 
-                # If observe ends normally or watchdog fires, reconnect
-                _LOGGER.warning("CoAP observe ended for %s, reconnecting...", self.host)
+                # If observe ends normally or watchdog fires, recover
+                _LOGGER.warning("CoAP observe ended for %s, recovering...", self.host)
 
             except asyncio.CancelledError:
                 _LOGGER.debug("CoAP observe cancelled for %s", self.host)
@@ -174,20 +818,43 @@ class HeaterObserveCoordinator:
 
             except Exception as err:
                 _LOGGER.error(
-                    "Error observing status for %s: %s. Reconnecting in %ds...",
-                    self.host, err, reconnect_delay,
+                    "Error observing status for %s: %s. Recovering...", self.host, err
                 )
 
-            # Wait before reconnecting
-            try:
-                await asyncio.sleep(reconnect_delay)
-            except asyncio.CancelledError:
-                raise
-
-            # Exponential backoff for retries
-            reconnect_delay = min(reconnect_delay * 2, max_reconnect_delay)
+            # The outage is not a heartbeat interval; don't let it skew the stats
+            self._last_update_at = None
+            self.energy.pause()
+            self.thermal.pause()
+
+            # Recover in tiers: re-observe on the same session, then re-sync the
+            # session keys, and only rebuild the client as a last resort.
+            recovery_tier += 1
+            if recovery_tier == 1:
+                self.metrics.recoveries["reobserve"] += 1
+                _LOGGER.debug("Re-issuing observe for %s", self.host)
+                await asyncio.sleep(RECOVERY_REOBSERVE_DELAY)
+                continue
+            if recovery_tier == 2:
+                self.metrics.recoveries["resync"] += 1
+                await asyncio.sleep(RECOVERY_RESYNC_DELAY)
+                try:
+                    _LOGGER.info("Re-syncing session with %s", self.host)
+                    await self._transport.async_resync(
+                        self.client, self.connect_priority, RECOVERY_RESYNC_TIMEOUT
+                    )
+                except asyncio.CancelledError:
+                    raise
+                except Exception as err:
+                    _LOGGER.warning(
+                        "Re-sync with %s failed: %s, rebuilding client", self.host, err
+                    )
+                else:
+                    continue
 
-            # Tear down the client so the top of the loop rebuilds it cleanly
+            # Tear down the client, then wait before the top of the loop
+            # rebuilds it; a queued command ends the wait early
+            self.metrics.recoveries["rebuild"] += 1
+            reconnect_delay = self._next_reconnect_delay(reconnect_delay)
             try:
                 if self.client:
                     await self.client.shutdown()
@@ -195,10 +862,49 @@ class HeaterObserveCoordinator:
                 _LOGGER.debug("Error shutting down client for %s (expected): %s", self.host, err)
             finally:
                 self.client = None
+                self.restored = False
+                self._connected.clear()
                 self._connected_at = None
                 self._last_update_at = None
-                self._longest_wait = 0.0
-                self._update_intervals = []
+                self._interval_stats.reset()
+                self.hass.loop.call_soon(self._async_notify_all)
+            _LOGGER.info("Rebuilding client for %s in %.0fs", self.host, reconnect_delay)
+            await self._async_backoff(reconnect_delay)
+
+    async def _async_backoff(self, delay: float) -> None:
+        """Sleep before reconnecting, waking early if a command needs a session.
+
+        A command that starts waiting wakes the loop at once, and while any
+        wait the delay is capped at COMMAND_RECONNECT_INTERVAL.
+        """
+        if self._waiting_commands:
+            delay = min(delay, COMMAND_RECONNECT_INTERVAL)
+        try:
+            await asyncio.wait_for(self._reconnect_now.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            return
+        self._reconnect_now.clear()
+        _LOGGER.debug("Reconnecting to %s early for a queued command", self.host)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up Philips Heater services, the fleet power manager and LAN discovery."""
+    async_setup_services(hass)
+    await async_setup_fleet(hass)
+    hass.http.register_view(HeaterMetricsView(hass))
+    discovery = hass.data[DATA_DISCOVERY] = HeaterDiscovery(hass)
+
+    async def _async_started(_hass: HomeAssistant) -> None:
+        discovery.async_start()
+        await discovery.async_request_scan()
+
+    async def _async_stop(_event: Event) -> None:
+        discovery.async_stop()
+        await hass.data[DATA_FLEET].async_shutdown()
+
+    async_at_started(hass, _async_started)
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop)
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -206,10 +912,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     host = entry.data[CONF_HOST]
 
-    coordinator = HeaterObserveCoordinator(hass, host, entry.entry_id)
+    # All heaters share one CoAP context; each entry holds a reference
+    transport = async_acquire_transport(hass)
+    coordinator = HeaterObserveCoordinator(hass, host, entry.entry_id, transport)
 
-    # Coordinator owns all connection logic; raises ConfigEntryNotReady if unreachable
-    await coordinator.async_start()
+    # Coordinator owns all connection logic and connects in the background,
+    # so an unreachable heater does not hold up setup. A heater just added
+    # by the config flow reuses the flow's synced session.
+    handoff = await async_get_handoff(hass).async_take(
+        entry.data.get("device_id", entry.entry_id), host
+    )
+    await coordinator.async_start(handoff)
 
     # Remove entities that no longer exist (polling was removed in 1.4)
     device_id = entry.data.get("device_id", entry.entry_id)
@@ -222,16 +935,23 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
+    hass.data[DATA_FLEET].async_add(entry.entry_id, coordinator)
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    entry.async_on_unload(entry.add_update_listener(async_entry_updated))
 
     return True
 
 
-async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Reload config entry when options change."""
-    await hass.config_entries.async_reload(entry.entry_id)
+async def async_entry_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply config entry changes, reloading only when the host changed."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    if entry.data[CONF_HOST] != coordinator.host:
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+    # Options only affect local behaviour and are read when used; no need
+    # to tear down the CoAP session
+    coordinator.async_options_updated()
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -240,7 +960,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
+        await hass.data[DATA_FLEET].async_remove(entry.entry_id)
         coordinator = hass.data[DOMAIN].pop(entry.entry_id)
         await coordinator.shutdown()
+        await async_release_transport(hass)
 
     return unload_ok
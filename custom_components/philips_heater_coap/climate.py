@@ -25,18 +25,12 @@ from .const import (
     DEFAULT_AUTO_PLUS_OFFSET,
     DEFAULT_HEAT_PRESET,
     DOMAIN,
-    HEATING_ACTION_MAP,
     MAX_TEMP,
     MIN_TEMP,
     OSCILLATION_OFF,
     OSCILLATION_ON,
-    OSCILLATION_STATUS,
     PhilipsApi,
-    PRESET_AUTO,
     PRESET_AUTO_PLUS,
-    PRESET_FAN,
-    PRESET_HIGH,
-    PRESET_LOW,
     PRESET_MODES,
     TARGET_TEMP_STEP,
 )
@@ -80,6 +74,17 @@ class PhilipsHeaterClimate(ClimateEntity):
     _attr_has_entity_name = True
     _attr_name = None  # Use device name
 
+    # Status fields this entity's state is derived from
+    _status_keys = (
+        PhilipsApi.POWER,
+        PhilipsApi.OPERATING_MODE,
+        PhilipsApi.TARGET_TEMP,
+        PhilipsApi.TEMPERATURE,
+        PhilipsApi.HEATING_STATUS,
+        PhilipsApi.OSCILLATION,
+        PhilipsApi.FAN_SPEED,
+    )
+
     def __init__(self, coordinator, entry: ConfigEntry, host: str, device_name: str, model: str, device_id: str) -> None:
         """Initialize the climate device."""
         self._coordinator = coordinator
@@ -105,7 +110,9 @@ class PhilipsHeaterClimate(ClimateEntity):
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
-        self._remove_listener = self._coordinator.async_add_listener(self._handle_coordinator_update)
+        self._remove_listener = self._coordinator.async_add_listener(
+            self._handle_coordinator_update, self._status_keys
+        )
 
     async def async_will_remove_from_hass(self) -> None:
         """When entity is removed from hass."""
@@ -120,104 +127,66 @@ class PhilipsHeaterClimate(ClimateEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self._coordinator.status is not None
+        return self._coordinator.available
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return entity specific state attributes."""
-        status = self._coordinator.status
+        state = self._coordinator.state
         attrs = {
-            "operating_mode": status.get(PhilipsApi.OPERATING_MODE, 0),
-            "heating_status_code": status.get(PhilipsApi.HEATING_STATUS, 0),
+            "operating_mode": state.operating_mode if state.operating_mode is not None else 0,
+            "heating_status_code": state.heating_status if state.heating_status is not None else 0,
         }
         
         # Add fan speed if available
-        if (fan_speed := status.get(PhilipsApi.FAN_SPEED)) is not None:
-            attrs["fan_speed"] = fan_speed
-            
+        if state.fan_speed is not None:
+            attrs["fan_speed"] = state.fan_speed
+
+        # Cached status shown until the first live push after startup
+        if self._coordinator.restored:
+            attrs["restored"] = True
+            if (age := self._coordinator.restored_age) is not None:
+                attrs["restored_age"] = round(age)
+
         return attrs
 
     @property
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
-        status = self._coordinator.status
-        temp = status.get(PhilipsApi.TEMPERATURE)
-        if temp is not None:
-            return temp / 10  # Device returns temp * 10
-        return None
+        return self._coordinator.state.current_temperature
 
     @property
     def target_temperature(self) -> int | None:
         """Return the target temperature - only applicable in AUTO mode."""
-        if self.hvac_mode != HVACMode.AUTO:
+        state = self._coordinator.state
+        if state.hvac_mode != HVACMode.AUTO:
             return None
-        
-        status = self._coordinator.status
-        return status.get(PhilipsApi.TARGET_TEMP)
+        return state.target_temperature
 
     @property
     def hvac_mode(self) -> HVACMode:
         """Return current HVAC mode."""
-        if not self.is_on:
-            return HVACMode.OFF
-        
-        status = self._coordinator.status
-        operating_mode = status.get(PhilipsApi.OPERATING_MODE, 0)
-        heating_status = status.get(PhilipsApi.HEATING_STATUS, 0)
-        
-        # Determine mode from OPERATING_MODE and HEATING_STATUS
-        # If heating_status is -16 (auto idle) or operating_mode is 0, we're in AUTO
-        if operating_mode == 0 or heating_status == -16:
-            return HVACMode.AUTO
-        # If operating_mode is -127 or heating_status is 0 (and not auto), we're in FAN_ONLY
-        elif operating_mode == -127 or (heating_status == 0 and operating_mode != 0):
-            return HVACMode.FAN_ONLY
-        # Otherwise manual heating (65=high, 66=low)
-        else:
-            return HVACMode.HEAT
+        return self._coordinator.state.hvac_mode
 
     @property
     def hvac_action(self) -> HVACAction | None:
         """Return current HVAC action."""
-        if not self.is_on:
-            return HVACAction.OFF
-        
-        status = self._coordinator.status
-        intensity = status.get(PhilipsApi.HEATING_STATUS, 0)
-        return HEATING_ACTION_MAP.get(intensity, HVACAction.IDLE)
+        return self._coordinator.state.hvac_action
 
     @property
     def preset_mode(self) -> str | None:
         """Return current preset mode."""
-        if not self.is_on:
-            return None
-        
-        status = self._coordinator.status
-        mode = status.get(PhilipsApi.OPERATING_MODE, 66)
-        
-        # Map OPERATING_MODE to preset
-        if mode == 0:
-            return PRESET_AUTO
-        elif mode == 65:
-            return PRESET_HIGH
-        elif mode == 66:
-            return PRESET_LOW
-        elif mode == -127:
-            return PRESET_FAN
-        return None
+        return self._coordinator.state.preset_mode
 
     @property
     def swing_mode(self) -> str:
         """Return swing mode."""
-        status = self._coordinator.status
-        osc = status.get(PhilipsApi.OSCILLATION, 0)
-        return SWING_ON if osc in (OSCILLATION_ON, OSCILLATION_STATUS) else SWING_OFF
+        return self._coordinator.state.swing_mode
 
     @property
     def is_on(self) -> bool:
         """Return True if device is on."""
-        status = self._coordinator.status
-        return status.get(PhilipsApi.POWER) == 1
+        return self._coordinator.state.is_on
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
@@ -227,56 +196,61 @@ class PhilipsHeaterClimate(ClimateEntity):
         temp = int(temp)
         temp = max(self._attr_min_temp, min(temp, self._attr_max_temp))
         
-        await self._coordinator.client.set_control_values({PhilipsApi.TARGET_TEMP: temp})
+        await self._coordinator.async_set_control_values({PhilipsApi.TARGET_TEMP: temp})
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set HVAC mode."""
         if hvac_mode == HVACMode.OFF:
             await self.async_turn_off()
-        elif hvac_mode == HVACMode.AUTO:
-            await self._coordinator.client.set_control_values({PhilipsApi.OPERATING_MODE: 0})
-            await self.async_turn_on()
+            return
+
+        if hvac_mode == HVACMode.AUTO:
+            values = {PhilipsApi.OPERATING_MODE: 0}
         elif hvac_mode == HVACMode.FAN_ONLY:
-            await self._coordinator.client.set_control_values({PhilipsApi.OPERATING_MODE: -127})
-            await self.async_turn_on()
+            values = {PhilipsApi.OPERATING_MODE: -127}
         elif hvac_mode == HVACMode.HEAT:
             # Use configured default heat preset
             default_preset = self._entry.options.get(CONF_DEFAULT_HEAT_PRESET, DEFAULT_HEAT_PRESET)
-            await self.async_set_preset_mode(default_preset)
-            await self.async_turn_on()
+            if default_preset == PRESET_AUTO_PLUS:
+                await self._async_start_auto_plus()
+                return
+            values = self._preset_values(default_preset) or {}
+        else:
+            return
+
+        # Mode and power go out in a single write
+        await self._coordinator.async_set_control_values({**values, PhilipsApi.POWER: 1})
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set preset mode."""
         if preset_mode == PRESET_AUTO_PLUS:
-            # Auto+ mode: set to auto and raise target temp by configured offset
-            offset = self._entry.options.get(CONF_AUTO_PLUS_OFFSET, DEFAULT_AUTO_PLUS_OFFSET)
-            current_temp = self.current_temperature
-            if current_temp is not None:
-                target = int(current_temp) + offset
-                target = max(self._attr_min_temp, min(target, self._attr_max_temp))
-                await self._coordinator.client.set_control_values({
-                    PhilipsApi.OPERATING_MODE: 0,  # Auto mode
-                    PhilipsApi.TARGET_TEMP: target,
-                })
-            else:
-                # Fallback to regular auto if no current temperature
-                await self._coordinator.client.set_control_values({PhilipsApi.OPERATING_MODE: 0})
-        elif preset_mode in PRESET_MODES:
-            await self._coordinator.client.set_control_values(PRESET_MODES[preset_mode])
-        else:
+            await self._async_start_auto_plus()
             return
-        
-        await self.async_turn_on()
+        if (values := self._preset_values(preset_mode)) is None:
+            return
+
+        await self._coordinator.async_set_control_values({**values, PhilipsApi.POWER: 1})
+
+    async def _async_start_auto_plus(self) -> None:
+        """Auto+ mode: raise target temp by configured offset, boosting if worthwhile."""
+        offset = self._entry.options.get(CONF_AUTO_PLUS_OFFSET, DEFAULT_AUTO_PLUS_OFFSET)
+        await self._coordinator.async_start_auto_plus(int(offset))
+
+    def _preset_values(self, preset_mode: str) -> dict[str, Any] | None:
+        """Return the control values that select a preset."""
+        if preset_mode in PRESET_MODES:
+            return PRESET_MODES[preset_mode]
+        return None
 
     async def async_set_swing_mode(self, swing_mode: str) -> None:
         """Set swing mode."""
         value = OSCILLATION_ON if swing_mode == SWING_ON else OSCILLATION_OFF
-        await self._coordinator.client.set_control_values({PhilipsApi.OSCILLATION: value})
+        await self._coordinator.async_set_control_values({PhilipsApi.OSCILLATION: value})
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn device on."""
-        await self._coordinator.client.set_control_values({PhilipsApi.POWER: 1})
+        await self._coordinator.async_set_control_values({PhilipsApi.POWER: 1})
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn device off."""
-        await self._coordinator.client.set_control_values({PhilipsApi.POWER: 0})
+        await self._coordinator.async_set_control_values({PhilipsApi.POWER: 0})
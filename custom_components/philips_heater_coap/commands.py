@@ -0,0 +1,127 @@
+"""Command queue for Philips Heater control writes."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+COMMAND_COALESCE_WINDOW = 0.15  # seconds to gather writes into one request
+COMMAND_DEADLINE = 30  # seconds a write may take, including waiting for a session
+
+# Reasons a command can fail, each with a translated message
+COMMAND_TIMEOUT = "timeout"  # the device did not acknowledge in time
+COMMAND_DISCONNECTED = "disconnected"  # no session came up before the deadline
+COMMAND_FAILED = "failed"  # the write failed, also when retried
+
+
+class CommandError(HomeAssistantError):
+    """A control write that was not acknowledged by the device."""
+
+    def __init__(self, host: str, values: dict[str, Any], reason: str) -> None:
+        """Initialize error."""
+        super().__init__(
+            translation_domain=DOMAIN,
+            translation_key=f"command_{reason}",
+            translation_placeholders={"host": host, "fields": ", ".join(sorted(values))},
+        )
+        self.host = host
+        self.values = values
+        self.reason = reason
+
+
+class CommandQueue:
+    """Per-device queue that merges control writes into one request.
+
+    Writes submitted within the coalescing window are merged into a single
+    set_control_values dict, with later values for a field replacing earlier
+    ones. Only one request is in flight at a time, and every caller whose
+    values were part of a request is resolved when the device acknowledges it.
+    A request must complete by the earliest deadline of the calls merged
+    into it, so no caller waits longer than it asked for.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        name: str,
+        send: Callable[[dict[str, Any], float], Awaitable[None]],
+        window: float = COMMAND_COALESCE_WINDOW,
+    ) -> None:
+        """Initialize queue."""
+        self.hass = hass
+        self._name = name
+        self._send = send
+        self._window = window
+        self._pending: dict[str, Any] = {}
+        self._deadline = float("inf")  # loop time the pending batch must finish by
+        self._waiters: list[asyncio.Future[None]] = []
+        self._flush_task: asyncio.Task | None = None  # batch still gathering writes
+        self._batch_tasks: set[asyncio.Task] = set()  # every batch not yet resolved
+        self._send_lock = asyncio.Lock()
+
+    async def async_submit(
+        self, values: dict[str, Any], timeout: float = COMMAND_DEADLINE
+    ) -> None:
+        """Queue values for writing and wait until the device acknowledges them."""
+        self._pending.update(values)
+        self._deadline = min(self._deadline, self.hass.loop.time() + timeout)
+        waiter: asyncio.Future[None] = self.hass.loop.create_future()
+        self._waiters.append(waiter)
+        if self._flush_task is None:
+            self._flush_task = self.hass.async_create_background_task(
+                self._async_flush(), f"philips_heater_coap command flush {self._name}"
+            )
+            self._batch_tasks.add(self._flush_task)
+            self._flush_task.add_done_callback(self._batch_tasks.discard)
+        await waiter
+
+    async def async_shutdown(self) -> None:
+        """Cancel queued and in-flight writes and fail their callers."""
+        self._flush_task = None
+        tasks = list(self._batch_tasks)
+        for task in tasks:
+            task.cancel()
+        waiters, self._waiters, self._pending = self._waiters, [], {}
+        self._deadline = float("inf")
+        for waiter in waiters:
+            waiter.cancel()
+        # In-flight batches cancel their own callers as they unwind
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _async_flush(self) -> None:
+        """Send everything gathered during the coalescing window."""
+        await asyncio.sleep(self._window)
+        values, waiters, deadline = self._pending, self._waiters, self._deadline
+        self._pending, self._waiters, self._deadline = {}, [], float("inf")
+        self._flush_task = None
+
+        try:
+            # Keep requests ordered; later batches wait for the in-flight one
+            async with self._send_lock:
+                _LOGGER.debug(
+                    "Sending %s to %s (%d merged calls)", values, self._name, len(waiters)
+                )
+                try:
+                    await self._send(values, deadline)
+                except Exception as err:
+                    for waiter in waiters:
+                        if not waiter.done():
+                            waiter.set_exception(err)
+                else:
+                    for waiter in waiters:
+                        if not waiter.done():
+                            waiter.set_result(None)
+        finally:
+            # Cancelled by shutdown; don't leave callers waiting forever
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.cancel()
@@ -3,69 +3,53 @@
 from __future__ import annotations
 
 import asyncio
+import ipaddress
 import logging
-from typing import Any
+import re
+from typing import TYPE_CHECKING, Any
 
-from aioairctrl import CoAPClient
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.const import CONF_HOST, CONF_NAME
+from homeassistant.const import CONF_HOST, CONF_HOSTS, CONF_NAME
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers.selector import TextSelector, TextSelectorConfig
 
-from .const import DOMAIN, PhilipsApi
+from .const import DOMAIN
+from .discovery import DISCOVERY_PROBE_TIMEOUT
+from .handoff import async_get_handoff
+from .probe import async_probe_host, entry_data_from_status, is_supported_status
+
+if TYPE_CHECKING:
+    from homeassistant.helpers.service_info.dhcp import DhcpServiceInfo
 
 _LOGGER = logging.getLogger(__name__)
 
-_BACKLIGHT_FIELD = "D03105"  # display backlight (0=off, 1=on)
+BULK_MAX_HOSTS = 1024  # max addresses probed by one bulk add
+BULK_PROBE_CONCURRENCY = 32  # hosts probed at once
+BULK_CONNECT_TIMEOUT = 5  # seconds to wait for each host's handshake
 
 
-async def _get_status_via_tickle(client: CoAPClient) -> dict | None:
-    """Get device status using the observe + brightness-tickle pattern.
+def _parse_hosts(text: str) -> list[str]:
+    """Expand a comma/whitespace separated list of addresses and CIDR ranges.
 
-    The device only pushes status notifications when state changes, so we
-    alternate the display backlight between 0 and 1 to force a push.
-    We start with 0 (off) because 1 (on) is the most common resting state,
-    making the first attempt the most likely to trigger a change.
-    Once a status update arrives we restore the backlight to its original value.
+    Raises ValueError for an invalid entry or more than BULK_MAX_HOSTS hosts.
     """
-    for write_value in (0, 1):
-        # Fresh generator each attempt — a cancelled __anext__() leaves the
-        # generator in a broken state and subsequent calls raise StopAsyncIteration.
-        observe_gen = client.observe_status()
-        try:
-            # Start the observe GET as a background task BEFORE sending the
-            # write, so the CoAP observe registration is in-flight when the
-            # device processes the write and decides to push a notification.
-            anext_task = asyncio.create_task(observe_gen.__anext__())
-            await asyncio.sleep(0.2)  # yield so the GET packet is dispatched
-
-            _LOGGER.debug(
-                "config_flow tickle: writing %s=%d", _BACKLIGHT_FIELD, write_value
-            )
-            await client.set_control_value(_BACKLIGHT_FIELD, write_value)
-
-            try:
-                status = await asyncio.wait_for(anext_task, timeout=5)
-            except (asyncio.TimeoutError, StopAsyncIteration):
-                # TimeoutError: device didn't respond — try the other value.
-                # StopAsyncIteration: observe stream ended unexpectedly.
-                anext_task.cancel()
-                await asyncio.gather(anext_task, return_exceptions=True)
-                continue
-
-            # Got status — restore backlight to its original state.
-            original_value = 1 - write_value
-            _LOGGER.debug(
-                "config_flow tickle: restoring %s=%d", _BACKLIGHT_FIELD, original_value
-            )
-            await client.set_control_value(_BACKLIGHT_FIELD, original_value)
-            return status
-        finally:
-            await observe_gen.aclose()
-
-    _LOGGER.warning("config_flow tickle: no status received after two attempts")
-    return None
+    hosts: dict[str, None] = {}  # ordered set
+    for token in re.split(r"[\s,;]+", text.strip()):
+        if not token:
+            continue
+        if "/" in token:
+            network = ipaddress.ip_network(token, strict=False)
+            if network.num_addresses > BULK_MAX_HOSTS:
+                raise ValueError(f"{token} is larger than {BULK_MAX_HOSTS} hosts")
+            addresses = [str(addr) for addr in network.hosts()] or [str(network.network_address)]
+        else:
+            addresses = [str(ipaddress.ip_address(token))]
+        hosts.update(dict.fromkeys(addresses))
+        if len(hosts) > BULK_MAX_HOSTS:
+            raise ValueError(f"more than {BULK_MAX_HOSTS} hosts")
+    return list(hosts)
 
 
 class PhilipsHeaterConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -73,48 +57,44 @@ class PhilipsHeaterConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    def __init__(self) -> None:
+        """Initialize flow."""
+        self._discovered: dict[str, Any] = {}
+        self._bulk_hosts: list[str] = []
+        self._bulk_task: asyncio.Task[dict[str, dict[str, Any]]] | None = None
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Handle the initial step."""
+        return self.async_show_menu(step_id="user", menu_options=["host", "bulk"])
+
+    async def async_step_host(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Add a single heater by address."""
         errors: dict[str, str] = {}
 
         if user_input is not None:
             host = user_input[CONF_HOST]
 
             try:
-                _LOGGER.debug("Connecting to device at %s", host)
-                client = await asyncio.wait_for(
-                    CoAPClient.create(host), timeout=30
-                )
-
-                try:
-                    _LOGGER.debug("Retrieving device status from %s via tickle", host)
-                    status = await _get_status_via_tickle(client)
-                finally:
-                    await client.shutdown()
+                status = await async_probe_host(self.hass, host, handoff=True)
 
                 if status is None:
                     errors["base"] = "cannot_connect"
                 else:
                     _LOGGER.debug("Successfully got status from %s", host)
 
-                    model     = status.get(PhilipsApi.MODEL_ID, "Unknown")
-                    name      = status.get(PhilipsApi.NAME, f"Philips Heater {host}")
-                    device_id = status.get(PhilipsApi.DEVICE_ID, host)
+                    title, data = entry_data_from_status(host, status)
 
-                    await self.async_set_unique_id(device_id)
+                    await self.async_set_unique_id(data["device_id"])
+                    if data["device_id"] in self._async_current_ids():
+                        # Already set up with its own session
+                        async_get_handoff(self.hass).async_discard(data["device_id"])
                     self._abort_if_unique_id_configured()
 
-                    return self.async_create_entry(
-                        title=name,
-                        data={
-                            CONF_HOST: host,
-                            CONF_NAME: name,
-                            "model": model,
-                            "device_id": device_id,
-                        },
-                    )
+                    return self.async_create_entry(title=title, data=data)
 
             except asyncio.TimeoutError:
                 errors["base"] = "cannot_connect"
@@ -123,9 +103,172 @@ class PhilipsHeaterConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 errors["base"] = "unknown"
 
         return self.async_show_form(
-            step_id="user",
+            step_id="host",
             data_schema=vol.Schema({
                 vol.Required(CONF_HOST): str,
             }),
             errors=errors,
         )
+
+    async def async_step_bulk(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Probe a list or range of addresses and add every heater found."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            try:
+                hosts = _parse_hosts(user_input[CONF_HOSTS])
+            except ValueError as err:
+                _LOGGER.debug("Invalid bulk host list: %s", err)
+                errors["base"] = "invalid_hosts"
+            else:
+                configured = {
+                    entry.data.get(CONF_HOST) for entry in self._async_current_entries()
+                }
+                self._bulk_hosts = [host for host in hosts if host not in configured]
+                return await self.async_step_bulk_probe()
+
+        return self.async_show_form(
+            step_id="bulk",
+            data_schema=vol.Schema({
+                vol.Required(CONF_HOSTS): TextSelector(
+                    TextSelectorConfig(multiline=True)
+                ),
+            }),
+            errors=errors,
+        )
+
+    async def async_step_bulk_probe(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Show progress while the bulk probe runs in the background."""
+        if self._bulk_task is None:
+            self._bulk_task = self.hass.async_create_task(
+                self._async_probe_hosts(self._bulk_hosts)
+            )
+        if not self._bulk_task.done():
+            return self.async_show_progress(
+                step_id="bulk_probe",
+                progress_action="bulk_probe",
+                progress_task=self._bulk_task,
+            )
+        return self.async_show_progress_done(next_step_id="bulk_done")
+
+    async def async_step_bulk_done(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Start an import flow for every new heater the bulk probe found."""
+        devices = self._bulk_task.result()
+        for data in devices.values():
+            self.hass.async_create_task(
+                self.hass.config_entries.flow.async_init(
+                    DOMAIN,
+                    context={"source": config_entries.SOURCE_IMPORT},
+                    data=data,
+                )
+            )
+
+        return self.async_abort(
+            reason="bulk_added",
+            description_placeholders={
+                "found": str(len(devices)),
+                "probed": str(len(self._bulk_hosts)),
+            },
+        )
+
+    async def _async_probe_hosts(self, hosts: list[str]) -> dict[str, dict[str, Any]]:
+        """Probe hosts concurrently; return entry data of new heaters by device id.
+
+        Hosts are identified read-only, so Philips purifiers and humidifiers
+        in the range are never written to; only supported heaters are kept.
+        """
+        semaphore = asyncio.Semaphore(BULK_PROBE_CONCURRENCY)
+        configured_ids = self._async_current_ids()
+
+        async def _probe(host: str) -> tuple[str, dict | None]:
+            async with semaphore:
+                try:
+                    return host, await async_probe_host(
+                        self.hass,
+                        host,
+                        timeout=BULK_CONNECT_TIMEOUT,
+                        handoff=True,
+                        read_only=True,
+                    )
+                except Exception as err:
+                    _LOGGER.debug("No heater at %s: %s", host, err)
+                    return host, None
+
+        handoff = async_get_handoff(self.hass)
+        devices: dict[str, dict[str, Any]] = {}
+        for host, status in await asyncio.gather(*(_probe(host) for host in hosts)):
+            if status is None or not is_supported_status(status):
+                continue
+            _, data = entry_data_from_status(host, status)
+            if data["device_id"] in configured_ids:
+                # Already set up with its own session
+                handoff.async_discard(data["device_id"])
+            else:
+                devices.setdefault(data["device_id"], data)
+        _LOGGER.info("Bulk add found %d heaters in %d hosts", len(devices), len(hosts))
+        return devices
+
+    async def async_step_import(self, data: dict[str, Any]) -> FlowResult:
+        """Create an entry for a heater found by the bulk step."""
+        await self.async_set_unique_id(data["device_id"])
+        self._abort_if_unique_id_configured()
+        return self.async_create_entry(title=data[CONF_NAME], data=data)
+
+    async def async_step_dhcp(self, discovery_info: DhcpServiceInfo) -> FlowResult:
+        """Handle a heater seen by DHCP."""
+        host = discovery_info.ip
+        self._async_abort_entries_match({CONF_HOST: host})
+
+        try:
+            status = await async_probe_host(
+                self.hass, host, DISCOVERY_PROBE_TIMEOUT, read_only=True
+            )
+        except Exception as err:
+            _LOGGER.debug("Could not identify %s: %s", host, err)
+            status = None
+        if status is None:
+            return self.async_abort(reason="cannot_connect")
+        if not is_supported_status(status):
+            return self.async_abort(reason="not_supported")
+
+        _, data = entry_data_from_status(host, status)
+        return await self.async_step_integration_discovery(data)
+
+    async def async_step_integration_discovery(
+        self, discovery_info: dict[str, Any]
+    ) -> FlowResult:
+        """Handle a heater found on the LAN."""
+        await self.async_set_unique_id(discovery_info["device_id"])
+        # A known heater at a new address only needs its host updated
+        # async_entry_updated reloads the entry when its host changes
+        self._abort_if_unique_id_configured(
+            updates={CONF_HOST: discovery_info[CONF_HOST]}, reload_on_update=False
+        )
+
+        self._discovered = discovery_info
+        self.context["title_placeholders"] = {"name": discovery_info[CONF_NAME]}
+        return await self.async_step_discovery_confirm()
+
+    async def async_step_discovery_confirm(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Confirm adding a discovered heater."""
+        if user_input is not None:
+            return self.async_create_entry(
+                title=self._discovered[CONF_NAME], data=self._discovered
+            )
+
+        self._set_confirm_only()
+        return self.async_show_form(
+            step_id="discovery_confirm",
+            description_placeholders={
+                "name": self._discovered[CONF_NAME],
+                "host": self._discovered[CONF_HOST],
+            },
+        )
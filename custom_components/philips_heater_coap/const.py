@@ -5,6 +5,17 @@ from homeassistant.components.climate import HVACAction
 DOMAIN = "philips_heater_coap"
 MANUFACTURER = "Philips"
 
+# hass.data key for the CoAP transport shared by all config entries
+DATA_TRANSPORT = f"{DOMAIN}_transport"
+# hass.data key for LAN discovery
+DATA_DISCOVERY = f"{DOMAIN}_discovery"
+# hass.data key for status priming statistics
+DATA_PRIMING = f"{DOMAIN}_priming"
+# hass.data key for the fleet power manager
+DATA_FLEET = f"{DOMAIN}_fleet"
+# hass.data key for config flow sessions awaiting their new entry
+DATA_HANDOFF = f"{DOMAIN}_handoff"
+
 # Supported models
 SUPPORTED_MODELS = {
     "CX3120": "Philips CX3120 Heater",
@@ -65,6 +76,14 @@ OPERATING_MODE_MAP = {
     -127: "Fan",
 }
 
+# Estimated electrical draw in watts per HEATING_STATUS value, by model.
+# Heating levels follow the rated output; fan and idle are approximate.
+HEATING_POWER = {
+    "CX3120": {65: 2000, 67: 1500, 66: 1000, 0: 20, -16: 5},
+    "CX5120": {65: 2200, 67: 1600, 66: 1100, 0: 25, -16: 5},
+}
+DEFAULT_HEATING_POWER = HEATING_POWER["CX3120"]
+
 # Valid heating mode values (includes Off for when power is 0)
 HEATING_MODE_VALUES = ["Off", "Auto", "High", "Low", "Fan"]
 
@@ -86,6 +105,8 @@ PRESET_MODES = {
 # Configuration options
 CONF_DEFAULT_HEAT_PRESET = "default_heat_preset"
 CONF_AUTO_PLUS_OFFSET = "auto_plus_offset"
+# Pseudo status field notified to listeners when entry options change
+OPTIONS_KEY = "options"
 
 # Default values for options
 DEFAULT_HEAT_PRESET = PRESET_LOW
@@ -0,0 +1,31 @@
+"""Diagnostics support for Philips Heater integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_FLEET, DOMAIN, PhilipsApi
+from .handoff import async_get_handoff
+from .probe import async_get_priming_stats
+
+TO_REDACT = {CONF_HOST, "device_id", PhilipsApi.DEVICE_ID}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    return {
+        "entry": async_redact_data(dict(entry.data), TO_REDACT),
+        "status": async_redact_data(coordinator.status, TO_REDACT),
+        **coordinator.async_diagnostics(),
+        "priming": async_get_priming_stats(hass).as_dict(),
+        "handoff": async_get_handoff(hass).as_dict(),
+        "fleet": hass.data[DATA_FLEET].async_diagnostics(entry.entry_id),
+    }
@@ -0,0 +1,226 @@
+"""LAN discovery of Philips heaters."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+import logging
+import os
+import struct
+import time
+from typing import Any
+
+from homeassistant.components import network
+from homeassistant.config_entries import SOURCE_INTEGRATION_DISCOVERY, ConfigEntry
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import discovery_flow
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import DATA_DISCOVERY, DOMAIN
+from .probe import async_probe_host, entry_data_from_status, is_supported_status
+
+_LOGGER = logging.getLogger(__name__)
+
+COAP_PORT = 5683
+COAP_MULTICAST = "224.0.1.187"  # All CoAP Nodes (RFC 7252)
+DISCOVERY_INTERVAL = timedelta(minutes=15)  # periodic scan interval
+DISCOVERY_COOLDOWN = 60  # min seconds between on-demand scans
+DISCOVERY_LISTEN_TIME = 3  # seconds to collect replies to a probe
+DISCOVERY_PROBE_TIMEOUT = 10  # seconds to identify a replying host
+DISCOVERY_NEGATIVE_TTL = 6 * 3600  # seconds before a non-heater is identified again
+DISCOVERY_RETRY_DELAY = 5 * 60  # seconds before a host that did not answer is tried again
+
+
+def _build_sync_request(message_id: int, token: bytes) -> bytes:
+    """Build a CoAP NON POST to /sys/dev/sync, the request every heater answers."""
+    header = struct.pack("!BBH", 0x50 | len(token), 0x02, message_id)  # ver 1, NON, POST
+    options = b"\xb3sys" + b"\x03dev" + b"\x04sync"  # Uri-Path (option 11)
+    payload = os.urandom(4).hex().upper().encode()
+    return header + token + options + b"\xff" + payload
+
+
+class _ProbeProtocol(asyncio.DatagramProtocol):
+    """Collect the addresses that answer a sync probe."""
+
+    def __init__(self, token: bytes) -> None:
+        """Initialize protocol."""
+        self.token = token
+        self.responders: set[str] = set()
+
+    def datagram_received(self, data: bytes, addr: tuple[str, Any]) -> None:
+        """Record a responder whose reply echoes our token."""
+        if len(data) < 4:
+            return
+        tkl = data[0] & 0x0F
+        if data[4 : 4 + tkl] == self.token:
+            self.responders.add(addr[0])
+
+
+async def async_scan_network(hass: HomeAssistant) -> set[str]:
+    """Broadcast a CoAP sync probe and return the addresses that replied."""
+    targets = {COAP_MULTICAST, "255.255.255.255"}
+    targets.update(
+        str(address) for address in await network.async_get_ipv4_broadcast_addresses(hass)
+    )
+    token = os.urandom(4)
+    protocol = _ProbeProtocol(token)
+    transport, _ = await hass.loop.create_datagram_endpoint(
+        lambda: protocol, local_addr=("0.0.0.0", 0), allow_broadcast=True
+    )
+    try:
+        request = _build_sync_request(int.from_bytes(os.urandom(2), "big"), token)
+        for target in targets:
+            try:
+                transport.sendto(request, (target, COAP_PORT))
+            except OSError as err:
+                _LOGGER.debug("Discovery probe to %s failed: %s", target, err)
+        await asyncio.sleep(DISCOVERY_LISTEN_TIME)
+    finally:
+        transport.close()
+    return protocol.responders
+
+
+class HeaterDiscovery:
+    """Find heaters on the LAN and keep configured entries' hosts current.
+
+    Replies to a broadcast/multicast CoAP probe are identified read-only by
+    DeviceId and model. New heaters are offered through discovery flows, and
+    a configured heater that reappears at a new address has its entry's host
+    updated. Identities are cached per address only for as long as scans
+    keep seeing it, and a move is always confirmed against the live host,
+    since DHCP may hand the address to another device.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize discovery."""
+        self.hass = hass
+        self._device_ids: dict[str, str] = {}  # host -> DeviceId of identified heaters
+        self._retry_at: dict[str, float] = {}  # host -> monotonic time to identify again
+        self._debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=DISCOVERY_COOLDOWN,
+            immediate=True,
+            function=self._async_scan,
+        )
+        self._unsub_interval = None
+
+    @callback
+    def async_start(self) -> None:
+        """Start periodic scanning."""
+        self._unsub_interval = async_track_time_interval(
+            self.hass, self._async_interval_scan, DISCOVERY_INTERVAL
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop periodic scanning."""
+        if self._unsub_interval:
+            self._unsub_interval()
+            self._unsub_interval = None
+        self._debouncer.async_shutdown()
+
+    async def async_request_scan(self) -> None:
+        """Scan soon, e.g. because a configured heater stopped answering."""
+        await self._debouncer.async_call()
+
+    async def _async_interval_scan(self, _now: Any) -> None:
+        """Scan on the periodic timer."""
+        await self._debouncer.async_call()
+
+    async def _async_scan(self) -> None:
+        """Probe the LAN and act on every heater found."""
+        try:
+            responders = await async_scan_network(self.hass)
+        except OSError as err:
+            _LOGGER.debug("Discovery scan failed: %s", err)
+            return
+        _LOGGER.debug("Discovery probe answered by %s", responders)
+
+        # Addresses that stopped answering may be reassigned; forget them
+        for cache in (self._device_ids, self._retry_at):
+            for host in cache.keys() - responders:
+                del cache[host]
+
+        entries = self.hass.config_entries.async_entries(DOMAIN)
+        known_hosts = {entry.data.get(CONF_HOST) for entry in entries}
+        unknown = [host for host in responders if host not in known_hosts]
+        await asyncio.gather(*(self._async_handle_host(host) for host in unknown))
+
+    async def _async_handle_host(self, host: str) -> None:
+        """Identify a replying host and update or offer its entry."""
+        if (retry_at := self._retry_at.get(host)) is not None:
+            if time.monotonic() < retry_at:
+                return
+            del self._retry_at[host]
+
+        if (device_id := self._device_ids.get(host)) is not None and (
+            self._async_entry_for(device_id) is None
+        ):
+            # Already identified and offered
+            return
+
+        # A new address, or a configured heater apparently at a new one:
+        # read the DeviceId from the live host before acting on it
+        if (data := await self._async_identify(host)) is None:
+            return
+        device_id = data["device_id"]
+
+        if (entry := self._async_entry_for(device_id)) is not None:
+            if entry.data.get(CONF_HOST) != host:
+                _LOGGER.info(
+                    "Heater %s moved from %s to %s, updating entry",
+                    device_id, entry.data.get(CONF_HOST), host,
+                )
+                self.hass.config_entries.async_update_entry(
+                    entry, data={**entry.data, CONF_HOST: host}
+                )
+            return
+
+        discovery_flow.async_create_flow(
+            self.hass,
+            DOMAIN,
+            context={"source": SOURCE_INTEGRATION_DISCOVERY},
+            data=data,
+        )
+
+    async def _async_identify(self, host: str) -> dict[str, Any] | None:
+        """Return entry data for host if it is a supported heater, caching the result.
+
+        Only a device that reported an unsupported model is skipped for
+        long; one that did not answer in time is tried again soon.
+        """
+        try:
+            status = await async_probe_host(
+                self.hass, host, DISCOVERY_PROBE_TIMEOUT, read_only=True
+            )
+        except Exception as err:
+            _LOGGER.debug("Could not identify %s: %s", host, err)
+            status = None
+        if status is None:
+            self._retry_at[host] = time.monotonic() + DISCOVERY_RETRY_DELAY
+            return None
+        if not is_supported_status(status):
+            _LOGGER.debug("%s is not a supported heater", host)
+            self._device_ids.pop(host, None)
+            self._retry_at[host] = time.monotonic() + DISCOVERY_NEGATIVE_TTL
+            return None
+        _, data = entry_data_from_status(host, status)
+        self._device_ids[host] = data["device_id"]
+        return data
+
+    @callback
+    def _async_entry_for(self, device_id: str) -> ConfigEntry | None:
+        """Return the config entry of a heater, if configured."""
+        for entry in self.hass.config_entries.async_entries(DOMAIN):
+            if entry.unique_id == device_id:
+                return entry
+        return None
+
+
+async def async_request_discovery(hass: HomeAssistant) -> None:
+    """Ask for a discovery scan if discovery is running."""
+    if (discovery := hass.data.get(DATA_DISCOVERY)) is not None:
+        await discovery.async_request_scan()
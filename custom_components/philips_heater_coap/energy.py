@@ -0,0 +1,101 @@
+"""Incremental heating time and energy estimation."""
+
+from __future__ import annotations
+
+import math
+from typing import Any
+
+from homeassistant.components.climate import HVACAction
+
+from .const import DEFAULT_HEATING_POWER, HEATING_ACTION_MAP, HEATING_POWER
+
+# Pseudo status field notified to listeners when the estimates change
+ENERGY_KEY = "energy"
+DUTY_CYCLE_WINDOW = 3600  # seconds, time constant of the duty cycle average
+
+HEATING_LEVELS = frozenset(
+    level for level, action in HEATING_ACTION_MAP.items() if action == HVACAction.HEATING
+)
+
+
+def heating_power(model: str | None, power: int | None, heating_status: int | None) -> float:
+    """Return the estimated draw in watts for a device state."""
+    if power != 1 or heating_status is None:
+        return 0.0
+    return float(HEATING_POWER.get(model, DEFAULT_HEATING_POWER).get(heating_status, 0))
+
+
+class HeatingIntegrator:
+    """Accumulate time per heating level and estimated energy, one push at a time.
+
+    Each push closes the segment opened by the previous one, charging its
+    duration to that push's heating level and wattage, so the cost per push
+    is O(1). A time-weighted moving average gives the recent duty cycle.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty totals."""
+        self.seconds: dict[int, float] = {}
+        self.energy_kwh = 0.0
+        self.duty_cycle: float | None = None
+        self._level: int | None = None
+        self._watts = 0.0
+        self._since: float | None = None
+
+    @property
+    def heating_seconds(self) -> float:
+        """Return the total time spent heating."""
+        return sum(self.seconds.get(level, 0.0) for level in HEATING_LEVELS)
+
+    def update(
+        self, now: float, level: int | None, watts: float, max_gap: float
+    ) -> bool:
+        """Close the open segment and start one at level.
+
+        Segments longer than max_gap are not counted, since the device's
+        state during them is unknown. Returns True if a total changed.
+        """
+        changed = False
+        if self._since is not None and self._level is not None:
+            elapsed = now - self._since
+            if 0 < elapsed <= max_gap:
+                self.seconds[self._level] = self.seconds.get(self._level, 0.0) + elapsed
+                self.energy_kwh += self._watts * elapsed / 3_600_000
+                heating = 1.0 if self._level in HEATING_LEVELS else 0.0
+                if self.duty_cycle is None:
+                    self.duty_cycle = heating
+                else:
+                    alpha = 1 - math.exp(-elapsed / DUTY_CYCLE_WINDOW)
+                    self.duty_cycle += alpha * (heating - self.duty_cycle)
+                changed = True
+        self._level = level
+        self._watts = watts
+        self._since = now
+        return changed
+
+    def pause(self) -> None:
+        """Drop the open segment, e.g. when the observe stream is lost."""
+        self._since = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the totals for persistence."""
+        return {
+            "seconds": {str(level): value for level, value in self.seconds.items()},
+            "energy_kwh": self.energy_kwh,
+            "duty_cycle": self.duty_cycle,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> HeatingIntegrator:
+        """Create an integrator from as_dict output, ignoring unusable data."""
+        integrator = cls()
+        try:
+            integrator.seconds = {
+                int(level): float(value) for level, value in data["seconds"].items()
+            }
+            integrator.energy_kwh = float(data["energy_kwh"])
+            if (duty_cycle := data.get("duty_cycle")) is not None:
+                integrator.duty_cycle = float(duty_cycle)
+        except (AttributeError, KeyError, TypeError, ValueError):
+            integrator = cls()
+        return integrator
@@ -0,0 +1,424 @@
+"""Fleet-wide power budget with load shedding across heaters."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import timedelta
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import (
+    DATA_FLEET,
+    DEFAULT_HEATING_POWER,
+    DOMAIN,
+    HEATING_POWER,
+    PhilipsApi,
+)
+from .energy import heating_power
+from .storage import CoalescingStore
+
+if TYPE_CHECKING:
+    from . import HeaterObserveCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_SET_POWER_BUDGET = "set_power_budget"
+ATTR_WATTS = "watts"
+
+FLEET_STORAGE_VERSION = 1
+FLEET_SAVE_DELAY = 10  # max seconds a budget or shedding change may go unpersisted
+FLEET_RELEASE_TIMEOUT = 10  # seconds to give a removed heater its mode back
+FLEET_COMMAND_TIMEOUT = 5  # seconds a shed or restore write may take
+FLEET_ROTATION_INTERVAL = timedelta(minutes=10)  # how often shed heaters are rotated
+FLEET_RESTORE_MARGIN = 0.1  # share of the budget kept free before restoring a heater
+FLEET_ROTATION_WEIGHT = 1.0  # priority (°C of deficit) gained per hour shed
+FLEET_ROTATION_HYSTERESIS = 0.5  # priority gap needed to swap two heaters
+
+MODE_AUTO = 0
+MODE_HIGH = 65
+MODE_LOW = 66
+MODE_FAN = -127
+
+# One shedding step down from each mode, and the HEATING_STATUS used to
+# estimate what a heater draws at most in that mode. Low and Fan are fixed
+# levels, so a heater shed from Auto stops following its target temperature
+# until it is restored
+_SHED_STEP = {MODE_HIGH: MODE_LOW, MODE_AUTO: MODE_LOW, MODE_LOW: MODE_FAN}
+_MODE_LEVEL = {MODE_HIGH: 65, MODE_AUTO: 65, MODE_LOW: 66, MODE_FAN: 0}
+
+# Status fields that can change a heater's draw
+_FLEET_KEYS = (PhilipsApi.POWER, PhilipsApi.OPERATING_MODE, PhilipsApi.HEATING_STATUS)
+
+SET_POWER_BUDGET_SCHEMA = vol.Schema(
+    {vol.Required(ATTR_WATTS): vol.All(vol.Coerce(int), vol.Range(min=0))}
+)
+
+
+def mode_power(model: str | None, mode: int) -> float:
+    """Return the most a heater of model can draw in an operating mode."""
+    return float(HEATING_POWER.get(model, DEFAULT_HEATING_POWER)[_MODE_LEVEL[mode]])
+
+
+@dataclass(slots=True)
+class _Shed:
+    """A heater running below the mode its user chose."""
+
+    requested: int
+    applied: int
+    since: float
+
+
+class FleetPowerManager:
+    """Keep the estimated draw of all heaters under a shared power budget.
+
+    Every change in a heater's power, mode or heating status triggers one
+    rebalance pass (coalesced across heaters pushing in the same loop
+    iteration). When the estimate exceeds the budget, heaters with the least
+    comfort deficit are stepped down High/Auto -> Low -> Fan; when there is
+    headroom, shed heaters are restored in order of need. Time spent shed
+    raises a heater's priority, so a periodic pass rotates the shedding.
+    All commands from one pass are sent to the heaters concurrently, and a
+    heater with a write in flight is left alone until it settles. Offline
+    heaters are neither counted nor commanded; their shed records wait.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize manager."""
+        self.hass = hass
+        self.budget: int = 0  # watts, 0 = no cap
+        self._coordinators: dict[str, HeaterObserveCoordinator] = {}
+        self._unsubs: dict[str, CALLBACK_TYPE] = {}
+        self._shed: dict[str, _Shed] = {}
+        # Saved shed records of heaters not set up yet since the last restart
+        self._saved_shed: dict[str, _Shed] = {}
+        self._rebalance_scheduled = False
+        self._inflight: dict[str, int] = {}  # entry_id -> mode being written
+        self._unsub_rotation: CALLBACK_TYPE | None = None
+        self._store = CoalescingStore(
+            hass,
+            FLEET_STORAGE_VERSION,
+            f"{DOMAIN}.fleet",
+            self._data_to_save,
+            FLEET_SAVE_DELAY,
+        )
+
+    async def async_load(self) -> None:
+        """Restore the saved budget and which heaters are shed."""
+        data = await self._store.async_load() or {}
+        now = time.monotonic()
+        self._saved_shed = {
+            entry_id: _Shed(shed["requested"], shed["applied"], now)
+            for entry_id, shed in data.get("shed", {}).items()
+        }
+        self._async_set_budget(int(data.get("budget", 0)))
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the budget and the modes shed heaters are owed."""
+        return {
+            "budget": self.budget,
+            "shed": {
+                entry_id: {"requested": shed.requested, "applied": shed.applied}
+                for entry_id, shed in (self._saved_shed | self._shed).items()
+            },
+        }
+
+    async def async_shutdown(self) -> None:
+        """Stop rotating and write pending changes."""
+        if self._unsub_rotation:
+            self._unsub_rotation()
+            self._unsub_rotation = None
+        await self._store.async_flush()
+
+    @callback
+    def async_add(self, entry_id: str, coordinator: HeaterObserveCoordinator) -> None:
+        """Manage a heater."""
+        self._coordinators[entry_id] = coordinator
+        if (shed := self._saved_shed.pop(entry_id, None)) is not None:
+            self._shed[entry_id] = shed
+        self._unsubs[entry_id] = coordinator.async_add_listener(
+            self._async_schedule_rebalance, _FLEET_KEYS
+        )
+        self._async_schedule_rebalance()
+
+    async def async_remove(self, entry_id: str) -> None:
+        """Stop managing a heater, giving back the mode it was shed from."""
+        coordinator = self._coordinators.pop(entry_id, None)
+        if unsub := self._unsubs.pop(entry_id, None):
+            unsub()
+        self._async_schedule_rebalance()
+        if (shed := self._shed.pop(entry_id, None)) is None:
+            return
+        self._store.async_schedule_save()
+        if coordinator is None or coordinator.client is None:
+            return
+        try:
+            await coordinator.async_set_control_values(
+                {PhilipsApi.OPERATING_MODE: shed.requested},
+                timeout=FLEET_RELEASE_TIMEOUT,
+            )
+        except HomeAssistantError as err:
+            _LOGGER.warning(
+                "Could not restore the mode of %s after shedding: %s", coordinator.host, err
+            )
+
+    @callback
+    def async_set_budget(self, watts: int) -> None:
+        """Set the fleet power budget (0 removes the cap)."""
+        self._async_set_budget(watts)
+        self._store.async_schedule_save()
+
+    @callback
+    def _async_set_budget(self, watts: int) -> None:
+        """Apply a budget and start or stop rotation."""
+        self.budget = watts
+        if watts and self._unsub_rotation is None:
+            self._unsub_rotation = async_track_time_interval(
+                self.hass, self._async_rotate, FLEET_ROTATION_INTERVAL
+            )
+        elif not watts and self._unsub_rotation is not None:
+            self._unsub_rotation()
+            self._unsub_rotation = None
+        self._async_schedule_rebalance()
+
+    @property
+    def estimated_draw(self) -> float:
+        """Return the fleet's current estimated draw in watts."""
+        return sum(
+            self._draw(c) for c in self._coordinators.values() if c.client is not None
+        )
+
+    @callback
+    def async_diagnostics(self, entry_id: str) -> dict[str, Any]:
+        """Return the fleet state as seen from one heater."""
+        shed = self._shed.get(entry_id)
+        return {
+            "power_budget": self.budget,
+            "estimated_draw": self.estimated_draw,
+            "heaters": len(self._coordinators),
+            "shed": repr(shed) if shed else None,
+        }
+
+    @staticmethod
+    def _draw(coordinator: HeaterObserveCoordinator) -> float:
+        """Return a heater's current estimated draw."""
+        state = coordinator.state
+        model = coordinator.status.get(PhilipsApi.MODEL_ID)
+        draw = heating_power(model, state.power, state.heating_status)
+        if state.is_on and state.operating_mode in _MODE_LEVEL:
+            # HEATING_STATUS lags a mode change; the mode caps the draw at once
+            draw = min(draw, mode_power(model, state.operating_mode))
+        return draw
+
+    def _priority(self, entry_id: str, now: float) -> float:
+        """Return how much a heater deserves power; higher is more deserving."""
+        state = self._coordinators[entry_id].state
+        priority = 0.0
+        if state.target_temperature is not None and state.current_temperature is not None:
+            priority = state.target_temperature - state.current_temperature
+        if (shed := self._shed.get(entry_id)) is not None:
+            priority += (now - shed.since) / 3600 * FLEET_ROTATION_WEIGHT
+        return priority
+
+    @callback
+    def _async_schedule_rebalance(self) -> None:
+        """Rebalance once all pushes handled in this loop iteration are in."""
+        if self._rebalance_scheduled:
+            return
+        self._rebalance_scheduled = True
+        self.hass.loop.call_soon(self._async_rebalance)
+
+    @callback
+    def _async_rotate(self, _now: Any) -> None:
+        """Periodically let long-shed heaters swap with less needy ones."""
+        self._async_rebalance(rotate=True)
+
+    @callback
+    def _async_rebalance(self, rotate: bool = False) -> None:
+        """Shed or restore heaters to fit the budget."""
+        self._rebalance_scheduled = False
+        now = time.monotonic()
+        dropped = False
+        # Estimated draw of every heater with a session; only these are commanded
+        draws: dict[str, float] = {}
+        for entry_id, coordinator in self._coordinators.items():
+            if coordinator.client is None:
+                continue
+            if (pending := self._inflight.get(entry_id)) is not None:
+                # Not acknowledged yet; assume the most the new mode draws
+                model = coordinator.status.get(PhilipsApi.MODEL_ID)
+                draws[entry_id] = mode_power(model, pending)
+                continue
+            draws[entry_id] = self._draw(coordinator)
+            state = coordinator.state
+            shed = self._shed.get(entry_id)
+            if (
+                shed is not None
+                and coordinator.status
+                and (not state.is_on or state.operating_mode != shed.applied)
+            ):
+                # Turned off or changed by someone else; their choice stands
+                del self._shed[entry_id]
+                dropped = True
+
+        commands: dict[str, int] = {}
+        total = sum(draws.values())
+
+        def _mode(entry_id: str) -> int | None:
+            if entry_id in commands:
+                return commands[entry_id]
+            if entry_id in self._inflight:
+                return self._inflight[entry_id]
+            if (shed := self._shed.get(entry_id)) is not None:
+                return shed.applied
+            state = self._coordinators[entry_id].state
+            return state.operating_mode if state.is_on else None
+
+        def _model(entry_id: str) -> str | None:
+            return self._coordinators[entry_id].status.get(PhilipsApi.MODEL_ID)
+
+        def _step_down(entry_id: str) -> float:
+            """Shed one step; return the estimated saving."""
+            mode = _mode(entry_id)
+            new_mode = _SHED_STEP[mode]
+            saving = max(0.0, draws[entry_id] - mode_power(_model(entry_id), new_mode))
+            commands[entry_id] = new_mode
+            draws[entry_id] -= saving
+            if entry_id not in self._shed:
+                # Shedding ends an Auto+ boost, so its High is owed back as Auto
+                requested = (
+                    MODE_AUTO
+                    if mode == MODE_HIGH and self._coordinators[entry_id].boosting
+                    else mode
+                )
+                self._shed[entry_id] = _Shed(requested, new_mode, now)
+            else:
+                self._shed[entry_id].applied = new_mode
+            return saving
+
+        def _step_up_cost(entry_id: str) -> tuple[int, float]:
+            """Return the next mode towards the requested one and its cost."""
+            shed = self._shed[entry_id]
+            mode = _mode(entry_id)
+            new_mode = (
+                MODE_LOW if mode == MODE_FAN and shed.requested != MODE_LOW else shed.requested
+            )
+            return new_mode, max(0.0, mode_power(_model(entry_id), new_mode) - draws[entry_id])
+
+        def _step_up(entry_id: str, new_mode: int, cost: float) -> None:
+            commands[entry_id] = new_mode
+            draws[entry_id] += cost
+            shed = self._shed[entry_id]
+            if new_mode == shed.requested:
+                del self._shed[entry_id]
+            else:
+                shed.applied = new_mode
+
+        def _settled(entry_id: str) -> bool:
+            """Return True if a heater is online with no write in flight."""
+            return entry_id in draws and entry_id not in self._inflight
+
+        def _sheddable() -> list[str]:
+            """Heaters that would save power by stepping down, least needy first."""
+            candidates = [
+                entry_id
+                for entry_id in draws
+                if _settled(entry_id)
+                and (mode := _mode(entry_id)) in _SHED_STEP
+                and draws[entry_id] > mode_power(_model(entry_id), _SHED_STEP[mode])
+            ]
+            return sorted(candidates, key=lambda e: self._priority(e, now))
+
+        budget = self.budget
+        if budget:
+            # Shed the least needy heaters until the estimate fits
+            while total > budget and (candidates := _sheddable()):
+                total -= _step_down(candidates[0])
+
+            # Restore the neediest shed heaters while there is headroom
+            limit = budget * (1 - FLEET_RESTORE_MARGIN)
+            for entry_id in sorted(
+                list(self._shed), key=lambda e: self._priority(e, now), reverse=True
+            ):
+                if entry_id in commands or not _settled(entry_id):
+                    continue
+                new_mode, cost = _step_up_cost(entry_id)
+                if total + cost <= limit:
+                    _step_up(entry_id, new_mode, cost)
+                    total += cost
+
+            waiting = [e for e in self._shed if _settled(e)]
+            if rotate and waiting:
+                # Swap the neediest shed heater with the least needy running one
+                needy = max(waiting, key=lambda e: self._priority(e, now))
+                running = [e for e in _sheddable() if e not in self._shed]
+                if (
+                    needy not in commands
+                    and running
+                    and self._priority(needy, now)
+                    > self._priority(running[0], now) + FLEET_ROTATION_HYSTERESIS
+                ):
+                    new_mode, cost = _step_up_cost(needy)
+                    other = running[0]
+                    saving = draws[other] - mode_power(
+                        _model(other), _SHED_STEP[_mode(other)]
+                    )
+                    if total + cost - saving <= budget:
+                        _step_down(other)
+                        _step_up(needy, new_mode, cost)
+                        total += cost - saving
+        else:
+            # No cap: give every shed heater back its mode
+            for entry_id, shed in list(self._shed.items()):
+                if _settled(entry_id):
+                    commands[entry_id] = shed.requested
+                    del self._shed[entry_id]
+
+        if commands or dropped:
+            self._store.async_schedule_save()
+        if commands:
+            _LOGGER.info(
+                "Fleet power budget %dW: setting modes %s (estimated draw %.0fW)",
+                budget,
+                {self._coordinators[e].host: mode for e, mode in commands.items()},
+                total,
+            )
+            for entry_id, mode in commands.items():
+                self._inflight[entry_id] = mode
+                self.hass.async_create_task(self._async_send(entry_id, mode))
+
+    async def _async_send(self, entry_id: str, mode: int) -> None:
+        """Send one heater's mode change, then let the fleet rebalance."""
+        coordinator = self._coordinators[entry_id]
+        try:
+            await coordinator.async_set_control_values(
+                {PhilipsApi.OPERATING_MODE: mode}, timeout=FLEET_COMMAND_TIMEOUT
+            )
+        except HomeAssistantError as err:
+            _LOGGER.warning("Fleet mode change for %s failed: %s", coordinator.host, err)
+        finally:
+            self._inflight.pop(entry_id, None)
+        self._async_schedule_rebalance()
+
+
+async def async_setup_fleet(hass: HomeAssistant) -> None:
+    """Create the fleet power manager and register its service."""
+    fleet = hass.data[DATA_FLEET] = FleetPowerManager(hass)
+    await fleet.async_load()
+
+    async def _async_set_power_budget(call: ServiceCall) -> None:
+        fleet.async_set_budget(call.data[ATTR_WATTS])
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_POWER_BUDGET,
+        _async_set_power_budget,
+        schema=SET_POWER_BUDGET_SCHEMA,
+    )
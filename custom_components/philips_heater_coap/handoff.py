@@ -0,0 +1,115 @@
+"""Hand config flow sessions over to the coordinator of the new entry."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import partial
+import logging
+from typing import Any
+
+from aioairctrl import CoAPClient
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import DATA_HANDOFF
+from .transport import async_acquire_transport, async_release_transport
+
+_LOGGER = logging.getLogger(__name__)
+
+HANDOFF_TTL = 60  # seconds a parked session waits for its entry to be set up
+
+
+@dataclass(slots=True)
+class HandoffSession:
+    """A synced client and the status it returned."""
+
+    host: str
+    client: CoAPClient
+    status: dict[str, Any]
+    cancel_expiry: CALLBACK_TYPE
+
+
+class SessionHandoffCache:
+    """Synced clients parked by device id until an entry adopts them.
+
+    Each parked session holds its own transport reference, so the shared
+    context stays open between the flow finishing and the entry loading.
+    Sessions nobody adopts within HANDOFF_TTL are shut down.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize empty cache."""
+        self.hass = hass
+        self._sessions: dict[str, HandoffSession] = {}
+        self.adopted = 0
+        self.expired = 0
+
+    @callback
+    def async_park(
+        self, device_id: str, host: str, client: CoAPClient, status: dict[str, Any]
+    ) -> None:
+        """Keep a client for the entry about to be created for device_id."""
+        self.async_discard(device_id)
+        async_acquire_transport(self.hass)
+        self._sessions[device_id] = HandoffSession(
+            host,
+            client,
+            status,
+            async_call_later(self.hass, HANDOFF_TTL, partial(self._async_expire, device_id)),
+        )
+
+    async def async_take(self, device_id: str, host: str) -> HandoffSession | None:
+        """Return the parked session for device_id at host, if any.
+
+        The caller must already hold its own transport reference.
+        """
+        if (session := self._sessions.pop(device_id, None)) is None:
+            return None
+        session.cancel_expiry()
+        if session.host != host:
+            await self._async_close(session)
+            return None
+        self.adopted += 1
+        await async_release_transport(self.hass)
+        return session
+
+    @callback
+    def async_discard(self, device_id: str) -> None:
+        """Shut down the parked session for device_id, if any."""
+        if (session := self._sessions.pop(device_id, None)) is not None:
+            session.cancel_expiry()
+            self.hass.async_create_task(self._async_close(session))
+
+    @callback
+    def _async_expire(self, device_id: str, _now: Any) -> None:
+        """Drop a session that was not adopted in time."""
+        if (session := self._sessions.pop(device_id, None)) is None:
+            return
+        _LOGGER.debug("Handoff session for %s expired", session.host)
+        self.expired += 1
+        self.hass.async_create_task(self._async_close(session))
+
+    async def _async_close(self, session: HandoffSession) -> None:
+        """Shut down a session and release its transport reference."""
+        try:
+            await session.client.shutdown()
+        except Exception as err:
+            _LOGGER.debug("Error shutting down handoff client (expected): %s", err)
+        await async_release_transport(self.hass)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return counters for diagnostics."""
+        return {
+            "parked": len(self._sessions),
+            "adopted": self.adopted,
+            "expired": self.expired,
+        }
+
+
+@callback
+def async_get_handoff(hass: HomeAssistant) -> SessionHandoffCache:
+    """Return the handoff cache shared by all flows."""
+    if (cache := hass.data.get(DATA_HANDOFF)) is None:
+        cache = hass.data[DATA_HANDOFF] = SessionHandoffCache(hass)
+    return cache
@@ -0,0 +1,104 @@
+"""In-memory time series of heater status."""
+
+from __future__ import annotations
+
+from array import array
+import math
+from typing import Any, NamedTuple
+
+from .const import PhilipsApi
+
+HISTORY_SIZE = 4320  # samples kept per heater (24h of ~20s heartbeats)
+_MISSING = -32768  # stored in integer columns for fields absent from a push
+
+
+class HistorySample(NamedTuple):
+    """One recorded status push."""
+
+    timestamp: float
+    temperature: float | None
+    target_temperature: int | None
+    heating_status: int | None
+    power: int | None
+
+
+class StatusHistory:
+    """Fixed-size ring buffer of status pushes.
+
+    Each field lives in its own typed array allocated up front, so memory is
+    fixed (about 22 bytes per sample) and appending never allocates. The
+    oldest sample is overwritten once the buffer is full.
+    """
+
+    def __init__(self, size: int = HISTORY_SIZE) -> None:
+        """Initialize an empty buffer holding up to size samples."""
+        self._size = size
+        self._timestamps = array("d", bytes(8 * size))
+        self._temperatures = array("d", bytes(8 * size))
+        self._targets = array("h", bytes(2 * size))
+        self._heating = array("h", bytes(2 * size))
+        self._power = array("h", bytes(2 * size))
+        self._next = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Return the number of samples held."""
+        return self._count
+
+    def append(self, timestamp: float, status: dict[str, Any]) -> None:
+        """Record the fields of a raw status push."""
+        i = self._next
+        temp = status.get(PhilipsApi.TEMPERATURE)
+        self._timestamps[i] = timestamp
+        self._temperatures[i] = temp / 10 if temp is not None else math.nan  # Device returns temp * 10
+        self._targets[i] = _int_or_missing(status.get(PhilipsApi.TARGET_TEMP))
+        self._heating[i] = _int_or_missing(status.get(PhilipsApi.HEATING_STATUS))
+        self._power[i] = _int_or_missing(status.get(PhilipsApi.POWER))
+        self._next = (i + 1) % self._size
+        if self._count < self._size:
+            self._count += 1
+
+    def samples(self, since: float | None = None) -> list[HistorySample]:
+        """Return samples oldest first, optionally only those at or after since."""
+        start = (self._next - self._count) % self._size
+        result = []
+        for offset in range(self._count):
+            i = (start + offset) % self._size
+            timestamp = self._timestamps[i]
+            if since is not None and timestamp < since:
+                continue
+            temp = self._temperatures[i]
+            result.append(
+                HistorySample(
+                    timestamp,
+                    None if math.isnan(temp) else temp,
+                    _value_or_none(self._targets[i]),
+                    _value_or_none(self._heating[i]),
+                    _value_or_none(self._power[i]),
+                )
+            )
+        return result
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the buffer contents as columns for diagnostics."""
+        samples = self.samples()
+        return {
+            "size": self._size,
+            "count": self._count,
+            **{
+                field: [getattr(sample, field) for sample in samples]
+                for field in HistorySample._fields
+            },
+        }
+
+
+def _int_or_missing(value: Any) -> int:
+    """Return value for an integer column."""
+    if isinstance(value, int) and _MISSING < value < 32768:
+        return value
+    return _MISSING
+
+
+def _value_or_none(value: int) -> int | None:
+    """Return a stored integer, or None if it was absent."""
+    return None if value == _MISSING else value
@@ -0,0 +1,184 @@
+"""OpenMetrics exporter for coordinator internals."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Iterable
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from . import HeaterObserveCoordinator
+
+METRICS_URL = f"/api/{DOMAIN}/metrics"
+METRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+METRIC_PREFIX = "philips_heater"
+
+# Histogram bucket upper bounds in seconds
+COMMAND_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DISPATCH_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.05)
+
+
+class Histogram:
+    """Fixed-bucket histogram; observe is O(log buckets) and allocation free."""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        """Initialize empty histogram."""
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Record a value."""
+        index = bisect_left(self.buckets, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+        self.sum += value
+        self.count += 1
+
+
+class HeaterMetrics:
+    """Counters and histograms collected by one coordinator."""
+
+    def __init__(self) -> None:
+        """Initialize zeroed metrics."""
+        self.pushes: defaultdict[str, int] = defaultdict(int)  # by StatusType
+        self.recoveries: defaultdict[str, int] = defaultdict(int)  # by recovery tier
+        self.connect_failures = 0
+        self.commands = 0  # send attempts, retries included
+        self.command_retries = 0
+        self.command_failures: defaultdict[str, int] = defaultdict(int)  # by reason
+        self.command_latency = Histogram(COMMAND_LATENCY_BUCKETS)
+        self.dispatch_time = Histogram(DISPATCH_BUCKETS)
+
+
+def _labels(labels: dict[str, str]) -> str:
+    """Format a label set."""
+    if not labels:
+        return ""
+    inner = ",".join(
+        '{}="{}"'.format(
+            key, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        )
+        for key, value in labels.items()
+    )
+    return "{" + inner + "}"
+
+
+def _format(value: float) -> str:
+    """Format a sample value."""
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render_openmetrics(coordinators: Iterable[HeaterObserveCoordinator]) -> str:
+    """Render the metrics of all coordinators in OpenMetrics text format."""
+    families: dict[str, tuple[str, str, list[str]]] = {}
+
+    def sample(
+        family: str,
+        kind: str,
+        help_text: str,
+        labels: dict[str, str],
+        value: float,
+        suffix: str = "",
+    ) -> None:
+        name = f"{METRIC_PREFIX}_{family}"
+        lines = families.setdefault(name, (kind, help_text, []))[2]
+        lines.append(f"{name}{suffix}{_labels(labels)} {_format(value)}")
+
+    def counter(family: str, help_text: str, labels: dict[str, str], value: int) -> None:
+        sample(family, "counter", help_text, labels, value, "_total")
+
+    def histogram(
+        family: str, help_text: str, labels: dict[str, str], hist: Histogram
+    ) -> None:
+        cumulative = 0
+        for bound, count in zip(hist.buckets, hist.counts):
+            cumulative += count
+            bucket_labels = {**labels, "le": repr(bound)}
+            sample(family, "histogram", help_text, bucket_labels, cumulative, "_bucket")
+        sample(family, "histogram", help_text, {**labels, "le": "+Inf"}, hist.count, "_bucket")
+        sample(family, "histogram", help_text, labels, hist.sum, "_sum")
+        sample(family, "histogram", help_text, labels, hist.count, "_count")
+
+    for coordinator in coordinators:
+        labels = {"host": coordinator.host}
+        metrics = coordinator.metrics
+        for status_type, count in sorted(metrics.pushes.items()):
+            counter("pushes", "Observe pushes received.", {**labels, "type": status_type}, count)
+        for tier, count in sorted(metrics.recoveries.items()):
+            counter("recoveries", "Observe recovery attempts.", {**labels, "tier": tier}, count)
+        counter(
+            "connect_failures", "Failed client connections.", labels, metrics.connect_failures
+        )
+        counter("commands", "Control value writes sent.", labels, metrics.commands)
+        counter(
+            "command_retries", "Control value writes resent.", labels, metrics.command_retries
+        )
+        for reason, count in sorted(metrics.command_failures.items()):
+            counter(
+                "command_failures",
+                "Control value writes that failed.",
+                {**labels, "reason": reason},
+                count,
+            )
+        counter(
+            "storage_saves",
+            "Cached status and learned data writes.",
+            labels,
+            coordinator.storage_saves,
+        )
+        histogram(
+            "command_latency_seconds",
+            "Control value write round trip.",
+            labels,
+            metrics.command_latency,
+        )
+        histogram(
+            "listener_dispatch_seconds",
+            "Time spent notifying listeners of a change.",
+            labels,
+            metrics.dispatch_time,
+        )
+        for family, (help_text, value) in coordinator.async_metric_gauges().items():
+            if value is not None:
+                sample(family, "gauge", help_text, labels, value)
+
+    output = []
+    for name, (kind, help_text, lines) in families.items():
+        output.append(f"# TYPE {name} {kind}")
+        output.append(f"# HELP {name} {help_text}")
+        output.extend(lines)
+    output.append("# EOF")
+    return "\n".join(output) + "\n"
+
+
+class HeaterMetricsView(HomeAssistantView):
+    """Serve coordinator metrics for scraping."""
+
+    url = METRICS_URL
+    name = f"api:{DOMAIN}:metrics"
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize view."""
+        self.hass = hass
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Return metrics for all loaded heaters."""
+        body = render_openmetrics(self.hass.data.get(DOMAIN, {}).values())
+        return web.Response(
+            status=HTTPStatus.OK,
+            body=body.encode(),
+            headers={"Content-Type": METRICS_CONTENT_TYPE},
+        )
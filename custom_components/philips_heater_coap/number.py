@@ -7,11 +7,11 @@ import logging
 from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo, EntityDescription
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import CONF_AUTO_PLUS_OFFSET, DEFAULT_AUTO_PLUS_OFFSET, DOMAIN
+from .const import CONF_AUTO_PLUS_OFFSET, DEFAULT_AUTO_PLUS_OFFSET, DOMAIN, OPTIONS_KEY
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -66,6 +66,7 @@ class AutoPlusOffsetNumber(NumberEntity):
         self._coordinator = coordinator
         self._entry = entry
         self._host = host
+        self._remove_listener = None
         self._attr_unique_id = f"{device_id}_auto_plus_offset"
         
         # Get device status for software version
@@ -83,6 +84,22 @@ class AutoPlusOffsetNumber(NumberEntity):
             configuration_url=f"http://{host}",
         )
 
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        self._remove_listener = self._coordinator.async_add_listener(
+            self._handle_coordinator_update, (OPTIONS_KEY,)
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """When entity is removed from hass."""
+        if self._remove_listener:
+            self._remove_listener()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle changed entry options."""
+        self.async_write_ha_state()
+
     @property
     def native_value(self) -> float:
         """Return the current Auto+ offset."""
@@ -0,0 +1,259 @@
+"""Pre-heat scheduling: start heaters so rooms are warm by a given time."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import logging
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+
+from homeassistant.components.climate import DOMAIN as CLIMATE_DOMAIN
+from homeassistant.const import ATTR_TEMPERATURE
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+import homeassistant.helpers.entity_registry as er
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.helpers.service import async_extract_referenced_entity_ids
+import homeassistant.util.dt as dt_util
+
+from .const import DOMAIN, MAX_TEMP, MIN_TEMP
+from .storage import CoalescingStore
+from .thermal import REGIME_COOLING, plan_auto_plus
+
+if TYPE_CHECKING:
+    from . import HeaterObserveCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_SCHEDULE_PREHEAT = "schedule_preheat"
+SERVICE_CANCEL_PREHEAT = "cancel_preheat"
+ATTR_READY_AT = "ready_at"
+
+PREHEAT_STORAGE_VERSION = 1
+PREHEAT_SAVE_DELAY = 10  # max seconds a schedule change may go unpersisted
+PREHEAT_REPLAN_INTERVAL = timedelta(minutes=15)  # re-estimate the start this often
+PREHEAT_DEFAULT_LEAD = timedelta(hours=1)  # lead time before the room is learned
+PREHEAT_MARGIN = timedelta(minutes=10)  # added to every learned lead time
+PREHEAT_MAX_LEAD = timedelta(hours=6)
+
+SCHEDULE_PREHEAT_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Required(ATTR_TEMPERATURE): vol.All(
+            vol.Coerce(int), vol.Range(min=MIN_TEMP, max=MAX_TEMP)
+        ),
+        vol.Required(ATTR_READY_AT): cv.datetime,
+    }
+)
+CANCEL_PREHEAT_SCHEMA = cv.make_entity_service_schema({})
+
+
+@dataclass(frozen=True, slots=True)
+class PreheatTarget:
+    """A temperature wanted by a point in time."""
+
+    ready_at: datetime
+    temperature: int
+
+
+class PreheatScheduler:
+    """Start one heater ahead of its scheduled targets.
+
+    Only the next target is tracked by a timer. Its start time is the ETA
+    of the Auto+ plan from the learned room model, allowing for the room to
+    keep cooling until then, and it is re-estimated every
+    PREHEAT_REPLAN_INTERVAL so it follows the actual room temperature.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, coordinator: HeaterObserveCoordinator, entry_id: str
+    ) -> None:
+        """Initialize scheduler."""
+        self.hass = hass
+        self._coordinator = coordinator
+        self.targets: list[PreheatTarget] = []
+        self._started: PreheatTarget | None = None
+        self.next_start: datetime | None = None
+        self._unsub: CALLBACK_TYPE | None = None
+        self._store = CoalescingStore(
+            hass,
+            PREHEAT_STORAGE_VERSION,
+            f"{DOMAIN}.{entry_id}.preheat",
+            self._data_to_save,
+            PREHEAT_SAVE_DELAY,
+        )
+
+    async def async_load(self) -> None:
+        """Restore saved targets and plan the next start."""
+        data = await self._store.async_load() or {}
+        targets = []
+        for item in data.get("targets", []):
+            if (ready_at := dt_util.parse_datetime(item["ready_at"])) is not None:
+                targets.append(PreheatTarget(ready_at, int(item["temperature"])))
+        self.targets = sorted(targets, key=lambda target: target.ready_at)
+        self._async_replan()
+
+    async def async_shutdown(self) -> None:
+        """Stop the timer and write pending changes."""
+        self._async_cancel_timer()
+        await self._store.async_flush()
+
+    @callback
+    def async_add(self, ready_at: datetime, temperature: int) -> None:
+        """Add a target, replacing any other target for the same time."""
+        self.targets = sorted(
+            [t for t in self.targets if t.ready_at != ready_at]
+            + [PreheatTarget(ready_at, temperature)],
+            key=lambda target: target.ready_at,
+        )
+        self._store.async_schedule_save()
+        self._async_replan()
+
+    @callback
+    def async_clear(self) -> None:
+        """Remove all targets."""
+        self.targets = []
+        self._started = None
+        self._store.async_schedule_save()
+        self._async_replan()
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the targets to persist."""
+        return {
+            "targets": [
+                {"ready_at": t.ready_at.isoformat(), "temperature": t.temperature}
+                for t in self.targets
+            ]
+        }
+
+    def _lead_time(self, target: PreheatTarget, now: datetime) -> timedelta:
+        """Return how long before ready_at heating must start."""
+        coordinator = self._coordinator
+        if (current := coordinator.state.current_temperature) is None:
+            return PREHEAT_DEFAULT_LEAD
+        thermal = coordinator.thermal
+        if (eta := plan_auto_plus(thermal, current, target.temperature).eta) is None:
+            return PREHEAT_DEFAULT_LEAD
+
+        # The room keeps cooling until the heater starts
+        until = (target.ready_at - now).total_seconds()
+        if (cooling := thermal.rate(REGIME_COOLING)) is not None and cooling < 0:
+            projected = current + cooling * max(0.0, until - eta) / 3600
+            eta = plan_auto_plus(thermal, projected, target.temperature).eta or eta
+        return min(timedelta(seconds=eta) + PREHEAT_MARGIN, PREHEAT_MAX_LEAD)
+
+    @callback
+    def _async_replan(self, _now: Any = None) -> None:
+        """Drop reached targets, start heating if due, and set the next timer."""
+        self._async_cancel_timer()
+        now = dt_util.utcnow()
+        if self.targets and self.targets[0].ready_at <= now:
+            self.targets = [t for t in self.targets if t.ready_at > now]
+            self._store.async_schedule_save()
+        if not self.targets:
+            self.next_start = None
+            return
+
+        target = self.targets[0]
+        if target == self._started:
+            # Already heating for it; wake when it is reached
+            self._async_set_timer(target.ready_at)
+            return
+
+        self.next_start = target.ready_at - self._lead_time(target, now)
+        if self.next_start > now:
+            self._async_set_timer(min(self.next_start, now + PREHEAT_REPLAN_INTERVAL))
+            return
+
+        _LOGGER.info(
+            "Pre-heating %s to %d°C for %s",
+            self._coordinator.host,
+            target.temperature,
+            target.ready_at.isoformat(),
+        )
+        self._started = target
+        self.hass.async_create_task(self._async_start(target))
+        self._async_set_timer(target.ready_at)
+
+    async def _async_start(self, target: PreheatTarget) -> None:
+        """Send the heat command for a target."""
+        try:
+            await self._coordinator.async_heat_to(target.temperature)
+        except Exception as err:
+            _LOGGER.error(
+                "Pre-heat of %s to %d°C failed: %s",
+                self._coordinator.host,
+                target.temperature,
+                err,
+            )
+
+    @callback
+    def _async_set_timer(self, when: datetime) -> None:
+        """Call _async_replan at when."""
+        self._unsub = async_track_point_in_utc_time(self.hass, self._async_replan, when)
+
+    @callback
+    def _async_cancel_timer(self) -> None:
+        """Cancel the pending timer."""
+        if self._unsub:
+            self._unsub()
+            self._unsub = None
+
+
+@callback
+def _async_coordinators(
+    hass: HomeAssistant, call: ServiceCall
+) -> list[HeaterObserveCoordinator]:
+    """Return the coordinators of the heaters targeted by call.
+
+    Entities named directly must be loaded Philips heaters; areas and
+    devices may also contain other entities, which are skipped.
+    """
+    registry = er.async_get(hass)
+    selected = async_extract_referenced_entity_ids(hass, call)
+    coordinators = []
+    for entity_id in sorted(selected.referenced | selected.indirectly_referenced):
+        entry = registry.async_get(entity_id)
+        if (
+            entry is None
+            or entry.platform != DOMAIN
+            or entry.domain != CLIMATE_DOMAIN
+            or (coordinator := hass.data.get(DOMAIN, {}).get(entry.config_entry_id)) is None
+        ):
+            if entity_id in selected.referenced:
+                raise ServiceValidationError(f"{entity_id} is not a loaded Philips heater")
+            continue
+        if coordinator not in coordinators:
+            coordinators.append(coordinator)
+    if not coordinators:
+        raise ServiceValidationError("No loaded Philips heater is targeted")
+    return coordinators
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the pre-heat services."""
+
+    async def _async_schedule(call: ServiceCall) -> None:
+        ready_at = call.data[ATTR_READY_AT]
+        if ready_at.tzinfo is None:
+            ready_at = ready_at.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
+        ready_at = dt_util.as_utc(ready_at)
+        if ready_at <= dt_util.utcnow():
+            raise ServiceValidationError(f"{ATTR_READY_AT} must be in the future")
+        for coordinator in _async_coordinators(hass, call):
+            coordinator.preheat.async_add(ready_at, call.data[ATTR_TEMPERATURE])
+
+    async def _async_cancel(call: ServiceCall) -> None:
+        for coordinator in _async_coordinators(hass, call):
+            coordinator.preheat.async_clear()
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_SCHEDULE_PREHEAT, _async_schedule, schema=SCHEDULE_PREHEAT_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_CANCEL_PREHEAT, _async_cancel, schema=CANCEL_PREHEAT_SCHEMA
+    )
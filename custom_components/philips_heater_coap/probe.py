@@ -0,0 +1,212 @@
+"""Probing heaters for their status outside of a coordinator."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from functools import partial
+import logging
+from typing import Any
+
+from aioairctrl import CoAPClient
+
+from homeassistant.const import CONF_HOST, CONF_NAME
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_PRIMING, SUPPORTED_MODELS, PhilipsApi
+from .handoff import async_get_handoff
+from .scheduler import HANDSHAKE_PRIORITY_INTERACTIVE
+from .transport import async_acquire_transport, async_release_transport
+
+_LOGGER = logging.getLogger(__name__)
+
+PRIME_OBSERVE_TIMEOUT = 2  # seconds to wait for a push after plain observe
+# Seconds a read-only probe waits for a push; heaters that don't answer the
+# observe registration push on a change or their ~20s heartbeat
+READ_ONLY_PUSH_TIMEOUT = 25
+PRIME_PUSH_TIMEOUT = 5  # seconds to wait for a push after a write
+
+PRIMING_STAGES = ("observe", "backlight")
+
+
+class PrimingStats:
+    """Attempts and successes of each status priming stage."""
+
+    def __init__(self) -> None:
+        """Initialize empty counters."""
+        self.attempts = dict.fromkeys(PRIMING_STAGES, 0)
+        self.successes = dict.fromkeys(PRIMING_STAGES, 0)
+
+    def record(self, stage: str, success: bool) -> None:
+        """Record the outcome of one stage."""
+        self.attempts[stage] += 1
+        if success:
+            self.successes[stage] += 1
+
+    def success_rate(self, stage: str) -> float | None:
+        """Return the fraction of attempts of stage that got a push."""
+        attempts = self.attempts[stage]
+        return self.successes[stage] / attempts if attempts else None
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        """Return the counters for diagnostics."""
+        return {
+            stage: {
+                "attempts": self.attempts[stage],
+                "successes": self.successes[stage],
+                "success_rate": self.success_rate(stage),
+            }
+            for stage in PRIMING_STAGES
+        }
+
+
+@callback
+def async_get_priming_stats(hass: HomeAssistant) -> PrimingStats:
+    """Return the priming statistics shared by all probes."""
+    if (stats := hass.data.get(DATA_PRIMING)) is None:
+        stats = hass.data[DATA_PRIMING] = PrimingStats()
+    return stats
+
+
+async def _async_await_push(
+    client: CoAPClient,
+    timeout: float,
+    write: Callable[[], Awaitable[Any]] | None = None,
+) -> dict | None:
+    """Register observe, optionally write, and return the first push."""
+    # Fresh generator each attempt — a cancelled __anext__() leaves the
+    # generator in a broken state and subsequent calls raise StopAsyncIteration.
+    observe_gen = client.observe_status()
+    try:
+        # Start the observe GET as a background task BEFORE sending the
+        # write, so the CoAP observe registration is in-flight when the
+        # device processes the write and decides to push a notification.
+        anext_task = asyncio.create_task(observe_gen.__anext__())
+        if write is not None:
+            await asyncio.sleep(0.2)  # yield so the GET packet is dispatched
+            await write()
+
+        try:
+            return await asyncio.wait_for(anext_task, timeout=timeout)
+        except (asyncio.TimeoutError, StopAsyncIteration):
+            # TimeoutError: device didn't respond.
+            # StopAsyncIteration: observe stream ended unexpectedly.
+            anext_task.cancel()
+            await asyncio.gather(anext_task, return_exceptions=True)
+            return None
+    finally:
+        await observe_gen.aclose()
+
+
+async def _get_status_via_tickle(client: CoAPClient) -> dict | None:
+    """Get device status using the observe + brightness-tickle pattern.
+
+    The device only pushes status notifications when state changes, so we
+    alternate the display backlight between 0 and 1 to force a push.
+    We start with 0 (off) because 1 (on) is the most common resting state,
+    making the first attempt the most likely to trigger a change.
+    Once a status update arrives we restore the backlight to its original value.
+    """
+    for write_value in (0, 1):
+        _LOGGER.debug(
+            "tickle: writing %s=%d", PhilipsApi.DISPLAY_BACKLIGHT, write_value
+        )
+        status = await _async_await_push(
+            client,
+            PRIME_PUSH_TIMEOUT,
+            partial(client.set_control_value, PhilipsApi.DISPLAY_BACKLIGHT, write_value),
+        )
+        if status is None:
+            continue
+
+        # Got status — restore backlight to its original state.
+        original_value = 1 - write_value
+        _LOGGER.debug(
+            "tickle: restoring %s=%d", PhilipsApi.DISPLAY_BACKLIGHT, original_value
+        )
+        await client.set_control_value(PhilipsApi.DISPLAY_BACKLIGHT, original_value)
+        return status
+
+    _LOGGER.warning("tickle: no status received after two attempts")
+    return None
+
+
+async def _async_prime_status(client: CoAPClient, stats: PrimingStats) -> dict | None:
+    """Get device status, trying the least intrusive way first.
+
+    1. Plain observe: many firmwares answer the registration at once.
+    2. Toggle the display backlight (visibly blinks the heater) and restore
+       it from the status that push returns.
+
+    No field is rewritten "as is" before anything has been read, since its
+    current value is unknown and the write could change the device.
+    """
+    status = await _async_await_push(client, PRIME_OBSERVE_TIMEOUT)
+    stats.record("observe", status is not None)
+    if status is not None:
+        _LOGGER.debug("priming: status from plain observe")
+        return status
+
+    status = await _get_status_via_tickle(client)
+    stats.record("backlight", status is not None)
+    return status
+
+
+async def async_probe_host(
+    hass: HomeAssistant,
+    host: str,
+    timeout: float = 30,
+    handoff: bool = False,
+    read_only: bool = False,
+) -> dict | None:
+    """Connect to host and return its status, or None if it did not respond.
+
+    With handoff, a client that returned a supported heater's status is
+    parked for the entry about to be created instead of being shut down. With read_only, only
+    a plain observe is tried, waiting out one heartbeat, and nothing is
+    ever written, so it is safe to use on unidentified devices (Philips
+    purifiers and humidifiers speak the same protocol).
+    """
+    stats = async_get_priming_stats(hass)
+    transport = async_acquire_transport(hass)
+    try:
+        _LOGGER.debug("Connecting to device at %s", host)
+        client = await transport.async_create_client(
+            host, priority=HANDSHAKE_PRIORITY_INTERACTIVE, timeout=timeout
+        )
+
+        status = None
+        try:
+            _LOGGER.debug("Retrieving device status from %s", host)
+            if read_only:
+                status = await _async_await_push(client, READ_ONLY_PUSH_TIMEOUT)
+            else:
+                status = await _async_prime_status(client, stats)
+        finally:
+            _LOGGER.debug("Priming success rates: %s", stats.as_dict())
+            if handoff and status is not None and is_supported_status(status):
+                _, data = entry_data_from_status(host, status)
+                async_get_handoff(hass).async_park(data["device_id"], host, client, status)
+            else:
+                await client.shutdown()
+        return status
+    finally:
+        await async_release_transport(hass)
+
+
+def is_supported_status(status: dict) -> bool:
+    """Return True if status comes from a supported heater model."""
+    return status.get(PhilipsApi.MODEL_ID) in SUPPORTED_MODELS
+
+
+def entry_data_from_status(host: str, status: dict) -> tuple[str, dict[str, Any]]:
+    """Return the entry title and data for a probed device."""
+    model     = status.get(PhilipsApi.MODEL_ID, "Unknown")
+    name      = status.get(PhilipsApi.NAME, f"Philips Heater {host}")
+    device_id = status.get(PhilipsApi.DEVICE_ID, host)
+    return name, {
+        CONF_HOST: host,
+        CONF_NAME: name,
+        "model": model,
+        "device_id": device_id,
+    }
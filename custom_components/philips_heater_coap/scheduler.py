@@ -0,0 +1,68 @@
+"""Fleet-wide scheduling of CoAP handshakes."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import heapq
+import itertools
+
+HANDSHAKE_CONCURRENCY = 4  # key exchanges allowed in flight across all heaters
+HANDSHAKE_PRIORITY_INTERACTIVE = float("inf")  # config flow probes, run in their own pool
+PROBE_CONCURRENCY = 32  # probe handshakes allowed in flight, apart from the fleet's
+
+
+class ConnectionScheduler:
+    """Bound concurrent handshakes, admitting the highest priority waiter first.
+
+    Coordinators pass the time they last received a push as the priority,
+    so after a restart or network flap the heaters that were healthy most
+    recently are back first and a dead one cannot hold up the rest.
+    """
+
+    def __init__(self, limit: int) -> None:
+        """Initialize scheduler."""
+        self._limit = limit
+        self._active = 0
+        self._waiters: list[tuple[float, int, asyncio.Future[None]]] = []
+        self._order = itertools.count()  # FIFO among equal priorities
+
+    @property
+    def active(self) -> int:
+        """Return the number of handshakes in flight."""
+        return self._active
+
+    @property
+    def waiting(self) -> int:
+        """Return the number of handshakes queued for a slot."""
+        return sum(1 for *_, future in self._waiters if not future.done())
+
+    @asynccontextmanager
+    async def async_slot(self, priority: float = 0.0) -> AsyncIterator[None]:
+        """Hold a handshake slot for the duration of the block."""
+        if self._active < self._limit and not self.waiting:
+            self._active += 1
+        else:
+            future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            heapq.heappush(self._waiters, (-priority, next(self._order), future))
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    # Granted a slot just as we were cancelled; pass it on
+                    self._release()
+                raise
+        try:
+            yield
+        finally:
+            self._release()
+
+    def _release(self) -> None:
+        """Hand the slot to the next waiter, or free it."""
+        while self._waiters:
+            *_, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._active -= 1
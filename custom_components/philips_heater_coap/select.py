@@ -7,7 +7,7 @@ import logging
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo, EntityDescription
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -15,6 +15,7 @@ from .const import (
     CONF_DEFAULT_HEAT_PRESET,
     DEFAULT_HEAT_PRESET,
     DOMAIN,
+    OPTIONS_KEY,
     PRESET_AUTO,
     PRESET_AUTO_PLUS,
     PRESET_FAN,
@@ -71,6 +72,7 @@ class DefaultHeatPresetSelect(SelectEntity):
         self._coordinator = coordinator
         self._entry = entry
         self._host = host
+        self._remove_listener = None
         self._attr_unique_id = f"{device_id}_default_heat_preset"
         
         # Get device status for software version
@@ -88,6 +90,22 @@ class DefaultHeatPresetSelect(SelectEntity):
             configuration_url=f"http://{host}",
         )
 
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        self._remove_listener = self._coordinator.async_add_listener(
+            self._handle_coordinator_update, (OPTIONS_KEY,)
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """When entity is removed from hass."""
+        if self._remove_listener:
+            self._remove_listener()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle changed entry options."""
+        self.async_write_ha_state()
+
     @property
     def current_option(self) -> str:
         """Return the current default heat preset."""
@@ -11,12 +11,19 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST, UnitOfTemperature
+from homeassistant.const import (
+    CONF_HOST,
+    PERCENTAGE,
+    UnitOfEnergy,
+    UnitOfTemperature,
+    UnitOfTime,
+)
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo, EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, PhilipsApi, HEATING_INTENSITY_MAP, HEATING_MODE_VALUES, OPERATING_MODE_MAP
+from .const import DOMAIN, PhilipsApi, HEATING_INTENSITY_MAP, HEATING_MODE_VALUES
+from .energy import ENERGY_KEY
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -38,6 +45,9 @@ async def async_setup_entry(
         PhilipsHeaterIntensitySensor(coordinator, entry, host, name, model, device_id),
         PhilipsHeaterHeatingModeSensor(coordinator, entry, host, name, model, device_id),
         PhilipsHeaterTargetTemperatureSensor(coordinator, entry, host, name, model, device_id),
+        PhilipsHeaterEnergySensor(coordinator, entry, host, name, model, device_id),
+        PhilipsHeaterHeatingTimeSensor(coordinator, entry, host, name, model, device_id),
+        PhilipsHeaterDutyCycleSensor(coordinator, entry, host, name, model, device_id),
     ]
     
     async_add_entities(sensors)
@@ -48,6 +58,9 @@ class PhilipsHeaterSensorBase(SensorEntity):
 
     _attr_has_entity_name = True
 
+    # Status fields this sensor's state is derived from (None = any field)
+    _status_keys: tuple[str, ...] | None = None
+
     def __init__(
         self,
         coordinator,
@@ -79,7 +92,9 @@ class PhilipsHeaterSensorBase(SensorEntity):
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
-        self._remove_listener = self._coordinator.async_add_listener(self._handle_coordinator_update)
+        self._remove_listener = self._coordinator.async_add_listener(
+            self._handle_coordinator_update, self._status_keys
+        )
 
     async def async_will_remove_from_hass(self) -> None:
         """When entity is removed from hass."""
@@ -94,7 +109,7 @@ class PhilipsHeaterSensorBase(SensorEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self._coordinator.status is not None
+        return self._coordinator.available
 
 
 class PhilipsHeaterTemperatureSensor(PhilipsHeaterSensorBase):
@@ -104,6 +119,7 @@ class PhilipsHeaterTemperatureSensor(PhilipsHeaterSensorBase):
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_name = "Temperature"
+    _status_keys = (PhilipsApi.TEMPERATURE,)
 
     def __init__(
         self,
@@ -121,12 +137,7 @@ class PhilipsHeaterTemperatureSensor(PhilipsHeaterSensorBase):
     @property
     def native_value(self) -> float | None:
         """Return the current temperature."""
-        status = self._coordinator.status
-        if status:
-            temp = status.get(PhilipsApi.TEMPERATURE)
-            if temp is not None:
-                return round(temp / 10, 1)  # Device returns temp * 10
-        return None
+        return self._coordinator.state.current_temperature
 
 
 class PhilipsHeaterIntensitySensor(PhilipsHeaterSensorBase):
@@ -136,6 +147,7 @@ class PhilipsHeaterIntensitySensor(PhilipsHeaterSensorBase):
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_options = list(HEATING_INTENSITY_MAP.values())
     _attr_name = "Heating Intensity"
+    _status_keys = (PhilipsApi.HEATING_STATUS,)
 
     def __init__(
         self,
@@ -153,12 +165,7 @@ class PhilipsHeaterIntensitySensor(PhilipsHeaterSensorBase):
     @property
     def native_value(self) -> str | None:
         """Return the current heating status."""
-        status = self._coordinator.status
-        if status:
-            heating_status = status.get(PhilipsApi.HEATING_STATUS)
-            if heating_status is not None:
-                return HEATING_INTENSITY_MAP.get(heating_status, "Unknown")
-        return None
+        return self._coordinator.state.heating_intensity
 
 
 class PhilipsHeaterHeatingModeSensor(PhilipsHeaterSensorBase):
@@ -168,6 +175,7 @@ class PhilipsHeaterHeatingModeSensor(PhilipsHeaterSensorBase):
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_options = HEATING_MODE_VALUES
     _attr_name = "Heating Mode"
+    _status_keys = (PhilipsApi.POWER, PhilipsApi.OPERATING_MODE)
 
     def __init__(
         self,
@@ -185,17 +193,7 @@ class PhilipsHeaterHeatingModeSensor(PhilipsHeaterSensorBase):
     @property
     def native_value(self) -> str | None:
         """Return the current heating mode."""
-        status = self._coordinator.status
-        if status:
-            # Check if power is off first
-            power = status.get(PhilipsApi.POWER)
-            if power == 0:
-                return "Off"
-            
-            operating_mode = status.get(PhilipsApi.OPERATING_MODE)
-            if operating_mode is not None:
-                return OPERATING_MODE_MAP.get(operating_mode, "Unknown")
-        return None
+        return self._coordinator.state.heating_mode
 
 
 class PhilipsHeaterTargetTemperatureSensor(PhilipsHeaterSensorBase):
@@ -206,6 +204,7 @@ class PhilipsHeaterTargetTemperatureSensor(PhilipsHeaterSensorBase):
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_name = "Target Temperature"
+    _status_keys = (PhilipsApi.POWER, PhilipsApi.TARGET_TEMP)
 
     def __init__(
         self,
@@ -223,14 +222,104 @@ class PhilipsHeaterTargetTemperatureSensor(PhilipsHeaterSensorBase):
     @property
     def native_value(self) -> float | None:
         """Return the target temperature."""
-        status = self._coordinator.status
-        if status:
-            # Don't report target temp when device is off
-            power = status.get(PhilipsApi.POWER)
-            if power == 0:
-                return None
-            
-            target_temp = status.get(PhilipsApi.TARGET_TEMP)
-            if target_temp is not None:
-                return target_temp
-        return None
+        state = self._coordinator.state
+        # Don't report target temp when device is off
+        if state.power == 0:
+            return None
+        return state.target_temperature
+
+
+class PhilipsHeaterEnergySensor(PhilipsHeaterSensorBase):
+    """Estimated energy consumption sensor for Philips Heater."""
+
+    _attr_device_class = SensorDeviceClass.ENERGY
+    _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_suggested_display_precision = 2
+    _attr_name = "Energy"
+    _status_keys = (ENERGY_KEY,)
+
+    def __init__(
+        self,
+        coordinator,
+        entry: ConfigEntry,
+        host: str,
+        device_name: str,
+        model: str,
+        device_id: str,
+    ) -> None:
+        """Initialize the energy sensor."""
+        super().__init__(coordinator, entry, host, device_name, model, device_id)
+        self._attr_unique_id = f"{device_id}_energy"
+
+    @property
+    def native_value(self) -> float:
+        """Return the estimated energy used."""
+        return round(self._coordinator.energy.energy_kwh, 3)
+
+
+class PhilipsHeaterHeatingTimeSensor(PhilipsHeaterSensorBase):
+    """Total heating time sensor for Philips Heater."""
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_native_unit_of_measurement = UnitOfTime.HOURS
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_suggested_display_precision = 2
+    _attr_name = "Heating Time"
+    _status_keys = (ENERGY_KEY,)
+
+    def __init__(
+        self,
+        coordinator,
+        entry: ConfigEntry,
+        host: str,
+        device_name: str,
+        model: str,
+        device_id: str,
+    ) -> None:
+        """Initialize the heating time sensor."""
+        super().__init__(coordinator, entry, host, device_name, model, device_id)
+        self._attr_unique_id = f"{device_id}_heating_time"
+
+    @property
+    def native_value(self) -> float:
+        """Return the total time spent heating."""
+        return round(self._coordinator.energy.heating_seconds / 3600, 3)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the time spent at each heating status."""
+        return {
+            f"{HEATING_INTENSITY_MAP.get(level, level)} ({level}) hours": round(seconds / 3600, 3)
+            for level, seconds in sorted(self._coordinator.energy.seconds.items())
+        }
+
+
+class PhilipsHeaterDutyCycleSensor(PhilipsHeaterSensorBase):
+    """Heating duty cycle sensor for Philips Heater."""
+
+    _attr_native_unit_of_measurement = PERCENTAGE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_suggested_display_precision = 0
+    _attr_name = "Duty Cycle"
+    _status_keys = (ENERGY_KEY,)
+
+    def __init__(
+        self,
+        coordinator,
+        entry: ConfigEntry,
+        host: str,
+        device_name: str,
+        model: str,
+        device_id: str,
+    ) -> None:
+        """Initialize the duty cycle sensor."""
+        super().__init__(coordinator, entry, host, device_name, model, device_id)
+        self._attr_unique_id = f"{device_id}_duty_cycle"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the share of the last hour (time-weighted) spent heating."""
+        duty_cycle = self._coordinator.energy.duty_cycle
+        return round(duty_cycle * 100, 1) if duty_cycle is not None else None
@@ -0,0 +1,101 @@
+"""Decoded heater state shared by all platforms."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from homeassistant.components.climate import SWING_OFF, SWING_ON, HVACAction, HVACMode
+
+from .const import (
+    HEATING_ACTION_MAP,
+    HEATING_INTENSITY_MAP,
+    OPERATING_MODE_MAP,
+    OSCILLATION_ON,
+    OSCILLATION_STATUS,
+    PRESET_AUTO,
+    PRESET_FAN,
+    PRESET_HIGH,
+    PRESET_LOW,
+    PhilipsApi,
+)
+
+_PRESET_BY_MODE = {0: PRESET_AUTO, 65: PRESET_HIGH, 66: PRESET_LOW, -127: PRESET_FAN}
+
+
+@dataclass(frozen=True, slots=True)
+class HeaterState:
+    """Immutable snapshot of a status push, decoded once for every entity."""
+
+    is_on: bool
+    power: int | None
+    operating_mode: int | None
+    heating_status: int | None
+    hvac_mode: HVACMode
+    hvac_action: HVACAction
+    preset_mode: str | None
+    swing_mode: str
+    current_temperature: float | None
+    target_temperature: int | None
+    fan_speed: int | None
+    heating_intensity: str | None
+    heating_mode: str | None
+
+    @classmethod
+    def from_status(cls, status: dict[str, Any]) -> HeaterState:
+        """Decode a raw status dict."""
+        power = status.get(PhilipsApi.POWER)
+        is_on = power == 1
+        operating_mode = status.get(PhilipsApi.OPERATING_MODE)
+        heating_status = status.get(PhilipsApi.HEATING_STATUS)
+        mode = operating_mode if operating_mode is not None else 0
+        intensity = heating_status if heating_status is not None else 0
+
+        if not is_on:
+            hvac_mode = HVACMode.OFF
+            hvac_action = HVACAction.OFF
+            preset_mode = None
+        else:
+            # If heating_status is -16 (auto idle) or operating_mode is 0, we're in AUTO
+            if mode == 0 or intensity == -16:
+                hvac_mode = HVACMode.AUTO
+            # If operating_mode is -127 or heating_status is 0 (and not auto), we're in FAN_ONLY
+            elif mode == -127 or intensity == 0:
+                hvac_mode = HVACMode.FAN_ONLY
+            # Otherwise manual heating (65=high, 66=low)
+            else:
+                hvac_mode = HVACMode.HEAT
+            hvac_action = HEATING_ACTION_MAP.get(intensity, HVACAction.IDLE)
+            preset_mode = _PRESET_BY_MODE.get(
+                operating_mode if operating_mode is not None else 66
+            )
+
+        osc = status.get(PhilipsApi.OSCILLATION, 0)
+        temp = status.get(PhilipsApi.TEMPERATURE)
+
+        if power == 0:
+            heating_mode = "Off"
+        elif operating_mode is not None:
+            heating_mode = OPERATING_MODE_MAP.get(operating_mode, "Unknown")
+        else:
+            heating_mode = None
+
+        return cls(
+            is_on=is_on,
+            power=power,
+            operating_mode=operating_mode,
+            heating_status=heating_status,
+            hvac_mode=hvac_mode,
+            hvac_action=hvac_action,
+            preset_mode=preset_mode,
+            swing_mode=SWING_ON if osc in (OSCILLATION_ON, OSCILLATION_STATUS) else SWING_OFF,
+            current_temperature=round(temp / 10, 1) if temp is not None else None,  # Device returns temp * 10
+            target_temperature=status.get(PhilipsApi.TARGET_TEMP),
+            fan_speed=status.get(PhilipsApi.FAN_SPEED),
+            heating_intensity=(
+                HEATING_INTENSITY_MAP.get(heating_status, "Unknown")
+                if heating_status is not None
+                else None
+            ),
+            heating_mode=heating_mode,
+        )
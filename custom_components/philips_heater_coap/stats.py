@@ -0,0 +1,184 @@
+"""Streaming statistics for observe update intervals."""
+
+from __future__ import annotations
+
+from collections import deque
+import math
+from typing import Any
+
+INTERVAL_HISTORY_SIZE = 64  # recent intervals kept for logging/diagnostics
+INTERVAL_QUANTILES = (0.5, 0.95, 0.99)
+
+
+class _P2Quantile:
+    """Constant-memory quantile estimator (Jain & Chlamtac P² algorithm).
+
+    Tracks five markers whose heights converge on the requested quantile,
+    so each update is O(1) regardless of how many samples have been seen.
+    """
+
+    __slots__ = ("_q", "_heights", "_positions", "_desired", "_increments")
+
+    def __init__(self, q: float) -> None:
+        """Initialize estimator for quantile q (0 < q < 1)."""
+        self._q = q
+        self._heights: list[float] = []
+        self._positions = [1, 2, 3, 4, 5]
+        self._desired = [1, 1 + 2 * q, 1 + 4 * q, 3 + 2 * q, 5]
+        self._increments = [0, q / 2, q, (1 + q) / 2, 1]
+
+    @property
+    def value(self) -> float | None:
+        """Return the current quantile estimate."""
+        heights = self._heights
+        if not heights:
+            return None
+        if len(heights) < 5:
+            ordered = sorted(heights)
+            return ordered[min(len(ordered) - 1, int(self._q * len(ordered)))]
+        return heights[2]
+
+    def add(self, x: float) -> None:
+        """Add an observation."""
+        heights = self._heights
+        if len(heights) < 5:
+            heights.append(x)
+            if len(heights) == 5:
+                heights.sort()
+            return
+
+        positions = self._positions
+        if x < heights[0]:
+            heights[0] = x
+            k = 0
+        elif x >= heights[4]:
+            heights[4] = x
+            k = 3
+        else:
+            k = 0
+            while k < 3 and x >= heights[k + 1]:
+                k += 1
+
+        for i in range(k + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        for i in (1, 2, 3):
+            d = self._desired[i] - positions[i]
+            if (d >= 1 and positions[i + 1] - positions[i] > 1) or (
+                d <= -1 and positions[i - 1] - positions[i] < -1
+            ):
+                step = 1 if d > 0 else -1
+                candidate = self._parabolic(i, step)
+                if not heights[i - 1] < candidate < heights[i + 1]:
+                    candidate = heights[i] + step * (
+                        heights[i + step] - heights[i]
+                    ) / (positions[i + step] - positions[i])
+                heights[i] = candidate
+                positions[i] += step
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the estimator state for persistence."""
+        return {
+            "heights": list(self._heights),
+            "positions": list(self._positions),
+            "desired": list(self._desired),
+        }
+
+    def restore(self, data: dict[str, Any]) -> None:
+        """Restore state saved by as_dict."""
+        self._heights = list(data["heights"])
+        self._positions = list(data["positions"])
+        self._desired = list(data["desired"])
+
+    def _parabolic(self, i: int, step: int) -> float:
+        """Piecewise-parabolic prediction of marker i moved by step."""
+        h = self._heights
+        n = self._positions
+        return h[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (h[i + 1] - h[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - step) * (h[i] - h[i - 1]) / (n[i] - n[i - 1])
+        )
+
+
+class IntervalStats:
+    """Bounded, O(1)-per-update statistics over observe push intervals.
+
+    Running mean and variance use Welford's method, recent intervals are kept
+    in a fixed-size ring buffer and P50/P95/P99 come from P² estimators, so
+    memory and CPU stay constant however long a connection lives.
+    """
+
+    def __init__(self, history_size: int = INTERVAL_HISTORY_SIZE) -> None:
+        """Initialize empty statistics."""
+        self.recent: deque[float] = deque(maxlen=history_size)
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard all collected statistics."""
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.longest = 0.0
+        self.recent.clear()
+        self._quantiles = {q: _P2Quantile(q) for q in INTERVAL_QUANTILES}
+
+    def add(self, interval: float) -> None:
+        """Record a new interval in seconds."""
+        self.count += 1
+        delta = interval - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (interval - self.mean)
+        if interval > self.longest:
+            self.longest = interval
+        self.recent.append(interval)
+        for estimator in self._quantiles.values():
+            estimator.add(interval)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics for persistence."""
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "m2": self._m2,
+            "longest": self.longest,
+            "quantiles": {str(q): est.as_dict() for q, est in self._quantiles.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> IntervalStats:
+        """Create statistics from as_dict output, ignoring unusable data."""
+        stats = cls()
+        try:
+            stats.count = int(data["count"])
+            stats.mean = float(data["mean"])
+            stats._m2 = float(data["m2"])
+            stats.longest = float(data["longest"])
+            for q, estimator in stats._quantiles.items():
+                estimator.restore(data["quantiles"][str(q)])
+        except (KeyError, TypeError, ValueError):
+            stats.reset()
+        return stats
+
+    @property
+    def last(self) -> float | None:
+        """Return the most recent interval."""
+        return self.recent[-1] if self.recent else None
+
+    @property
+    def variance(self) -> float | None:
+        """Return the sample variance."""
+        if self.count < 2:
+            return None
+        return self._m2 / (self.count - 1)
+
+    @property
+    def stddev(self) -> float | None:
+        """Return the sample standard deviation."""
+        variance = self.variance
+        return math.sqrt(variance) if variance is not None else None
+
+    def quantile(self, q: float) -> float | None:
+        """Return the estimate for one of INTERVAL_QUANTILES."""
+        return self._quantiles[q].value
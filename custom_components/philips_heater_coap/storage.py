@@ -0,0 +1,77 @@
+"""Storage helpers for Philips Heater integration."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+
+class CoalescingStore(Store[dict[str, Any]]):
+    """Store that coalesces frequent changes into bounded-staleness writes.
+
+    The first change after a write starts a timer and later changes ride along
+    with it, so the stored data is never older than max_staleness. A change
+    can ask for a tighter bound, which brings the pending write forward.
+    Pending changes are written by async_flush and on Home Assistant shutdown.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        version: int,
+        key: str,
+        data_func: Callable[[], dict[str, Any]],
+        max_staleness: float,
+    ) -> None:
+        """Initialize store."""
+        super().__init__(hass, version, key)
+        self._data_func = data_func
+        self._max_staleness = max_staleness
+        self._due: float | None = None  # loop time of the pending write
+        self.saves = 0  # writes performed, for metrics
+
+    @callback
+    def async_schedule_save(self, max_staleness: float | None = None) -> None:
+        """Schedule a coalesced write of the current data.
+
+        max_staleness overrides the store's bound for this change; a pending
+        write is brought forward to meet it but never postponed.
+        """
+        delay = self._max_staleness if max_staleness is None else max_staleness
+        due = self.hass.loop.time() + delay
+        if self._due is not None and self._due <= due:
+            return
+        self._due = due
+        self.async_delay_save(self._async_data_to_save, delay)
+
+    async def async_flush(self) -> None:
+        """Write any pending change immediately."""
+        if self._due is not None:
+            # async_save supersedes the scheduled delayed write
+            await self.async_save(self._async_data_to_save())
+
+    @callback
+    def _async_data_to_save(self) -> dict[str, Any]:
+        """Return the data to persist."""
+        self._due = None
+        self.saves += 1
+        return self._data_func()
+
+
+class StatusStore(CoalescingStore):
+    """Cached device status with the time it was saved.
+
+    Version 1 stored the bare status dict; version 2 wraps it as
+    {"status": ..., "saved_at": <unix time>} so restored state has an age.
+    """
+
+    async def _async_migrate_func(
+        self, old_major_version: int, old_minor_version: int, old_data: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Migrate to the latest version."""
+        if old_major_version == 1:
+            return {"status": old_data, "saved_at": None}
+        return old_data
@@ -0,0 +1,169 @@
+"""Learned room heating/cooling rates and Auto+ planning."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from .energy import HEATING_LEVELS
+
+REGIME_HIGH = "high"
+REGIME_LOW = "low"
+REGIME_AUTO = "auto"
+REGIME_COOLING = "cooling"  # off, fan only, or Auto idling at target
+
+RATE_MIN_SEGMENT = 300  # seconds in one regime before its slope is trusted
+RATE_MAX_SEGMENT = 1800  # long segments are closed so rates stay current
+RATE_SMOOTHING = 0.3  # weight of the newest segment in a learned rate
+RATE_MIN_SEGMENTS = 3  # segments needed before a rate is used for planning
+
+BOOST_MIN_GAP = 1.0  # °C below target before boosting on High is considered
+BOOST_HANDOVER_MARGIN = 0.5  # °C below target at which High hands over to Auto
+BOOST_MIN_SAVING = 300  # seconds High must save over Auto to be worth its power
+BOOST_MAX_DURATION = 7200  # seconds, hard cap on one boost
+
+
+def thermal_regime(
+    power: int | None, operating_mode: int | None, heating_status: int | None
+) -> str | None:
+    """Return how the heater is acting on the room, or None if unknown."""
+    if power is None:
+        return None
+    if power != 1 or heating_status not in HEATING_LEVELS:
+        return REGIME_COOLING
+    if operating_mode == 65:
+        return REGIME_HIGH
+    if operating_mode == 66:
+        return REGIME_LOW
+    if operating_mode == 0:
+        return REGIME_AUTO
+    return None
+
+
+class ThermalModel:
+    """Per-room temperature rates (°C/hour) learned for each heating regime.
+
+    Pushes are grouped into segments of constant regime; when a segment of
+    at least RATE_MIN_SEGMENT closes, its end-to-end slope is blended into
+    that regime's rate. Using whole segments rather than consecutive pushes
+    keeps the 0.1 °C sensor resolution from dominating the estimate.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an untrained model."""
+        self.rates: dict[str, float] = {}
+        self.segments: dict[str, int] = {}
+        self._regime: str | None = None
+        self._start: tuple[float, float] | None = None
+        self._last: tuple[float, float] | None = None
+
+    def rate(self, regime: str) -> float | None:
+        """Return the learned rate for regime once it is trustworthy."""
+        if self.segments.get(regime, 0) < RATE_MIN_SEGMENTS:
+            return None
+        return self.rates.get(regime)
+
+    def update(
+        self, now: float, regime: str | None, temperature: float | None, max_gap: float
+    ) -> bool:
+        """Record a push. Returns True if a learned rate changed."""
+        if (
+            regime is None
+            or temperature is None
+            or (self._last is not None and now - self._last[0] > max_gap)
+        ):
+            # Unknown state or a silent stretch; start over at the next push
+            changed = self._close_segment()
+            self.pause()
+            return changed
+
+        changed = False
+        if regime != self._regime or (
+            self._start is not None and now - self._start[0] >= RATE_MAX_SEGMENT
+        ):
+            changed = self._close_segment()
+            self._regime = regime
+            self._start = (now, temperature)
+        self._last = (now, temperature)
+        return changed
+
+    def pause(self) -> None:
+        """Drop the open segment, e.g. when the observe stream is lost."""
+        self._regime = None
+        self._start = None
+        self._last = None
+
+    def _close_segment(self) -> bool:
+        """Blend the open segment's slope into its regime's rate."""
+        if self._regime is None or self._start is None or self._last is None:
+            return False
+        duration = self._last[0] - self._start[0]
+        if duration < RATE_MIN_SEGMENT:
+            return False
+        slope = (self._last[1] - self._start[1]) * 3600 / duration
+        regime = self._regime
+        previous = self.rates.get(regime)
+        self.rates[regime] = (
+            slope if previous is None else previous + RATE_SMOOTHING * (slope - previous)
+        )
+        self.segments[regime] = self.segments.get(regime, 0) + 1
+        return True
+
+    def time_to_reach(self, regime: str, current: float, target: float) -> float | None:
+        """Return seconds to warm from current to target in regime, if reachable."""
+        if (rate := self.rate(regime)) is None or rate <= 0:
+            return None
+        return max(0.0, target - current) * 3600 / rate
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the learned rates for persistence."""
+        return {"rates": dict(self.rates), "segments": dict(self.segments)}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ThermalModel:
+        """Create a model from as_dict output, ignoring unusable data."""
+        model = cls()
+        try:
+            model.rates = {str(k): float(v) for k, v in data["rates"].items()}
+            model.segments = {str(k): int(v) for k, v in data["segments"].items()}
+        except (AttributeError, KeyError, TypeError, ValueError):
+            model = cls()
+        return model
+
+
+@dataclass(frozen=True, slots=True)
+class AutoPlusPlan:
+    """How Auto+ will reach its target."""
+
+    target: int
+    # Run High until the room reaches handover_temperature, then Auto
+    boost: bool
+    handover_temperature: float | None
+    # Predicted seconds until the target is reached, if the rates are known
+    eta: float | None
+
+
+def plan_auto_plus(model: ThermalModel, current: float, target: int) -> AutoPlusPlan:
+    """Choose between Auto and a High boost for reaching target.
+
+    Boosting is only chosen when the learned rates say High reaches the
+    handover point at least BOOST_MIN_SAVING sooner than Auto would reach
+    the target; otherwise Auto alone is cheaper for the same comfort.
+    """
+    gap = target - current
+    auto_eta = model.time_to_reach(REGIME_AUTO, current, target)
+    if gap < BOOST_MIN_GAP:
+        return AutoPlusPlan(target, False, None, auto_eta)
+
+    handover = target - BOOST_HANDOVER_MARGIN
+    high_eta = model.time_to_reach(REGIME_HIGH, current, handover)
+    finish_eta = model.time_to_reach(REGIME_AUTO, handover, target)
+    if high_eta is None:
+        return AutoPlusPlan(target, False, None, auto_eta)
+    if auto_eta is None:
+        # Auto has never been seen warming this room; High is the only known way
+        return AutoPlusPlan(target, True, handover, None)
+    boost_eta = high_eta + (finish_eta or 0.0)
+    if auto_eta - boost_eta < BOOST_MIN_SAVING:
+        return AutoPlusPlan(target, False, None, auto_eta)
+    return AutoPlusPlan(target, True, handover, boost_eta)
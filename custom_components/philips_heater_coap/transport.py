@@ -0,0 +1,131 @@
+"""Shared CoAP transport for all configured heaters."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from aioairctrl import CoAPClient
+from aioairctrl.coap.encryption import EncryptionContext
+from aiocoap import Context
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_TRANSPORT
+from .scheduler import (
+    HANDSHAKE_CONCURRENCY,
+    HANDSHAKE_PRIORITY_INTERACTIVE,
+    PROBE_CONCURRENCY,
+    ConnectionScheduler,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SharedCoAPClient(CoAPClient):
+    """CoAP client that runs over a shared aiocoap context.
+
+    Each client keeps its own encryption session with its host; only the
+    UDP socket and the protocol's background tasks are shared.
+    """
+
+    def __init__(self, host: str, context: Context, port: int = 5683) -> None:
+        """Initialize client bound to a shared context."""
+        super().__init__(host, port)
+        self._shared_context = context
+
+    async def async_connect(self) -> None:
+        """Start a new encryption session with the device."""
+        self._client_context = self._shared_context
+        self._encryption_context = EncryptionContext()
+        await self._sync()
+
+    async def async_resync(self) -> None:
+        """Re-run the key exchange without creating a new client."""
+        self._encryption_context = EncryptionContext()
+        await self._sync()
+
+    async def shutdown(self) -> None:
+        """Drop the session; the shared context stays open for other heaters."""
+        self._client_context = None
+
+
+class SharedCoAPTransport:
+    """Reference-counted aiocoap context multiplexing every heater."""
+
+    def __init__(self) -> None:
+        """Initialize transport."""
+        self._context: Context | None = None
+        self._refs = 0
+        self._lock = asyncio.Lock()
+        self.scheduler = ConnectionScheduler(HANDSHAKE_CONCURRENCY)
+        self.probe_scheduler = ConnectionScheduler(PROBE_CONCURRENCY)
+
+    async def async_create_client(
+        self, host: str, priority: float = 0.0, timeout: float | None = None
+    ) -> SharedCoAPClient:
+        """Create a synced client for host over the shared context.
+
+        The handshake waits for a slot in the fleet-wide scheduler, or in the
+        probe pool for interactive priority; timeout only applies once the
+        slot is held.
+        """
+        async with self._lock:
+            if self._context is None:
+                _LOGGER.debug("Creating shared CoAP context")
+                self._context = await Context.create_client_context()
+            context = self._context
+        client = SharedCoAPClient(host, context)
+        async with self._scheduler_for(priority).async_slot(priority):
+            await asyncio.wait_for(client.async_connect(), timeout)
+        return client
+
+    async def async_resync(
+        self, client: SharedCoAPClient, priority: float = 0.0, timeout: float | None = None
+    ) -> None:
+        """Re-run a client's key exchange within the handshake limit."""
+        async with self._scheduler_for(priority).async_slot(priority):
+            await asyncio.wait_for(client.async_resync(), timeout)
+
+    def _scheduler_for(self, priority: float) -> ConnectionScheduler:
+        """Keep config flow probes from queueing behind the fleet, and vice versa."""
+        if priority == HANDSHAKE_PRIORITY_INTERACTIVE:
+            return self.probe_scheduler
+        return self.scheduler
+
+    def acquire(self) -> None:
+        """Register a user of the transport."""
+        self._refs += 1
+
+    async def async_release(self) -> bool:
+        """Unregister a user; return True once the transport is closed."""
+        self._refs -= 1
+        if self._refs > 0:
+            return False
+        async with self._lock:
+            if self._context is not None:
+                _LOGGER.debug("Shutting down shared CoAP context")
+                try:
+                    await self._context.shutdown()
+                except Exception as err:
+                    # aiocoap can have race conditions during cleanup
+                    _LOGGER.debug("Error shutting down shared context (expected): %s", err)
+                self._context = None
+        # A new user may have arrived while the context was closing
+        return self._refs == 0
+
+
+@callback
+def async_acquire_transport(hass: HomeAssistant) -> SharedCoAPTransport:
+    """Return the shared transport, registering the caller as a user."""
+    if (transport := hass.data.get(DATA_TRANSPORT)) is None:
+        transport = hass.data[DATA_TRANSPORT] = SharedCoAPTransport()
+    transport.acquire()
+    return transport
+
+
+async def async_release_transport(hass: HomeAssistant) -> None:
+    """Release a reference taken with async_acquire_transport."""
+    transport: SharedCoAPTransport = hass.data[DATA_TRANSPORT]
+    if await transport.async_release() and hass.data.get(DATA_TRANSPORT) is transport:
+        hass.data.pop(DATA_TRANSPORT)
@@ -0,0 +1,202 @@
+"""Benchmark the observe-to-state pipeline against simulated heaters.
+
+Drives real HeaterObserveCoordinator instances (with a real Home Assistant
+core and Store) from simulated observe streams, and reports per-update CPU
+time, event loop lag, memory growth, storage writes and entity state writes
+as JSON so results can be compared between releases:
+
+    python -m scripts.benchmark --devices 1 10 100 500 --rate 1 --duration 30
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.philips_heater_coap import (
+    STORAGE_SAVE_DELAY,
+    HeaterObserveCoordinator,
+)
+from custom_components.philips_heater_coap.climate import PhilipsHeaterClimate
+from custom_components.philips_heater_coap.sensor import (
+    PhilipsHeaterDutyCycleSensor,
+    PhilipsHeaterEnergySensor,
+    PhilipsHeaterHeatingModeSensor,
+    PhilipsHeaterHeatingTimeSensor,
+    PhilipsHeaterIntensitySensor,
+    PhilipsHeaterTargetTemperatureSensor,
+    PhilipsHeaterTemperatureSensor,
+)
+
+from .simulator import SimulatedTransport, SimulatorProfile, build_fleet
+
+# Entities subscribed per heater, mirroring what the platforms register
+ENTITY_CLASSES = (
+    PhilipsHeaterClimate,
+    PhilipsHeaterTemperatureSensor,
+    PhilipsHeaterIntensitySensor,
+    PhilipsHeaterHeatingModeSensor,
+    PhilipsHeaterTargetTemperatureSensor,
+    PhilipsHeaterEnergySensor,
+    PhilipsHeaterHeatingTimeSensor,
+    PhilipsHeaterDutyCycleSensor,
+)
+LAG_PROBE_INTERVAL = 0.05  # seconds between event loop lag probes
+
+
+def _percentile(values: list[float], q: float) -> float | None:
+    """Return the q-quantile of values."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def _summary(values: list[float]) -> dict[str, float | None]:
+    """Return mean/p50/p99/max of values."""
+    return {
+        "mean": statistics.fmean(values) if values else None,
+        "p50": _percentile(values, 0.5),
+        "p99": _percentile(values, 0.99),
+        "max": max(values) if values else None,
+    }
+
+
+async def _async_probe_lag(samples: list[float], stop: asyncio.Event) -> None:
+    """Measure how late the event loop wakes a sleeping task."""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + LAG_PROBE_INTERVAL
+        await asyncio.sleep(LAG_PROBE_INTERVAL)
+        samples.append(max(0.0, loop.time() - expected))
+
+
+async def async_run_scenario(
+    devices: int, rate: float, duration: float, save_delay: float
+) -> dict[str, Any]:
+    """Run one scenario and return its measurements."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        profile = SimulatorProfile(
+            heartbeat_interval=1 / rate,
+            heartbeat_jitter=0.1 / rate,
+            latency=0.0,
+            time_scale=60,
+        )
+        transport = SimulatedTransport(build_fleet(devices, profile))
+
+        update_times: list[float] = []
+        storage_writes = 0
+        state_writes = 0
+
+        def _count_state_write() -> None:
+            nonlocal state_writes
+            state_writes += 1
+
+        coordinators = []
+        for index, host in enumerate(transport.heaters):
+            coordinator = HeaterObserveCoordinator(
+                hass, host, f"bench{index}", transport, save_delay=save_delay
+            )
+            handle_status = coordinator._async_handle_status
+
+            def _timed(status: dict[str, Any], _handle=handle_status) -> None:
+                start = time.perf_counter()
+                _handle(status)
+                update_times.append(time.perf_counter() - start)
+
+            coordinator._async_handle_status = _timed
+
+            for store in (coordinator._store, coordinator._learned_store):
+
+                async def _counted(*args: Any, _write=store._async_write_data) -> None:
+                    nonlocal storage_writes
+                    storage_writes += 1
+                    await _write(*args)
+
+                store._async_write_data = _counted
+
+            for entity_class in ENTITY_CLASSES:
+                coordinator.async_add_listener(_count_state_write, entity_class._status_keys)
+            coordinators.append(coordinator)
+
+        tracemalloc.start()
+        memory_start, _ = tracemalloc.get_traced_memory()
+        cpu_start = time.process_time()
+
+        await asyncio.gather(*(coordinator.async_start() for coordinator in coordinators))
+        lag_samples: list[float] = []
+        stop = asyncio.Event()
+        lag_task = asyncio.create_task(_async_probe_lag(lag_samples, stop))
+        await asyncio.sleep(duration)
+        stop.set()
+        await lag_task
+
+        cpu_used = time.process_time() - cpu_start
+        memory_end, memory_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        await asyncio.gather(*(coordinator.shutdown() for coordinator in coordinators))
+        await hass.async_stop(force=True)
+
+    updates = len(update_times)
+    return {
+        "devices": devices,
+        "rate_per_device": rate,
+        "duration": duration,
+        "updates": updates,
+        "update_cpu_seconds": _summary(update_times),
+        "process_cpu_seconds": cpu_used,
+        "process_cpu_per_update": cpu_used / updates if updates else None,
+        "loop_lag_seconds": _summary(lag_samples),
+        "memory_growth_bytes": memory_end - memory_start,
+        "memory_peak_bytes": memory_peak - memory_start,
+        "storage_writes": storage_writes,
+        "state_writes": state_writes,
+        "state_writes_per_update": state_writes / updates if updates else None,
+        "handshakes": transport.handshakes,
+    }
+
+
+async def _async_main(args: argparse.Namespace) -> dict[str, Any]:
+    """Run every requested scenario."""
+    results = [
+        await async_run_scenario(devices, args.rate, args.duration, args.save_delay)
+        for devices in args.devices
+    ]
+    return {
+        "python": sys.version.split()[0],
+        "timestamp": time.time(),
+        "scenarios": results,
+    }
+
+
+def main() -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, nargs="+", default=[1, 10, 100, 500])
+    parser.add_argument("--rate", type=float, default=1.0, help="pushes per second per device")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds per scenario")
+    parser.add_argument("--save-delay", type=float, default=STORAGE_SAVE_DELAY)
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    args = parser.parse_args()
+
+    report = json.dumps(asyncio.run(_async_main(args)), indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(report)
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
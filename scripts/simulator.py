@@ -0,0 +1,362 @@
+"""Simulated Philips heaters for exercising the integration without hardware.
+
+SimulatedTransport is a drop-in for SharedCoAPTransport: hand it to
+HeaterObserveCoordinator (or install it in hass.data[DATA_TRANSPORT]) and every
+client it creates talks to an in-process SimulatedHeater instead of a device.
+Each heater has scriptable heartbeat cadence, latency, packet loss,
+disconnects and a simple thermal model of the room it is heating.
+
+Run directly to watch a few simulated heaters push status:
+
+    python -m scripts.simulator --heaters 3 --duration 60 --heartbeat 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+import logging
+import random
+import time
+from typing import Any
+
+from custom_components.philips_heater_coap.const import PhilipsApi
+from custom_components.philips_heater_coap.scheduler import (
+    HANDSHAKE_CONCURRENCY,
+    HANDSHAKE_PRIORITY_INTERACTIVE,
+    PROBE_CONCURRENCY,
+    ConnectionScheduler,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Room heating rate in °C per hour for each HEATING_STATUS value
+HEAT_RATES = {65: 3.0, 67: 2.0, 66: 1.2, 0: 0.0, -16: 0.0}
+HEAT_LOSS_COEFFICIENT = 0.3  # fraction of the room/ambient gap lost per hour
+
+
+@dataclass
+class SimulatorProfile:
+    """Scriptable behaviour of a simulated heater and its network link."""
+
+    heartbeat_interval: float = 20.0  # seconds between status pushes
+    heartbeat_jitter: float = 0.5  # +/- seconds added to each heartbeat
+    latency: float = 0.02  # one-way network latency in seconds
+    packet_loss: float = 0.0  # probability a push or write is lost
+    connect_failure_rate: float = 0.0  # probability a handshake fails
+    disconnect_after: float | None = None  # end each observe stream after N seconds
+    ambient_temp: float = 15.0  # °C the room cools towards
+    time_scale: float = 1.0  # thermal model speed-up over wall clock
+
+
+class SimulatedNetworkError(OSError):
+    """Raised when a simulated request is lost or the heater is offline."""
+
+
+class SimulatedHeater:
+    """In-process heater state, thermal model and push fan-out."""
+
+    def __init__(
+        self,
+        host: str,
+        model: str = "CX5120",
+        profile: SimulatorProfile | None = None,
+        seed: int | None = None,
+    ) -> None:
+        """Initialize heater."""
+        self.host = host
+        self.profile = profile or SimulatorProfile()
+        self.online = True
+        self.writes = 0
+        self.pushes = 0
+        self._random = random.Random(seed)
+        self._room_temp = self.profile.ambient_temp + 3
+        self._last_step = time.monotonic()
+        self._streams: set[asyncio.Queue[dict[str, Any] | None]] = set()
+        self.state: dict[str, Any] = {
+            PhilipsApi.NAME: f"Simulated {model} {host}",
+            PhilipsApi.TYPE: "heater",
+            PhilipsApi.MODEL_ID: model,
+            PhilipsApi.SOFTWARE_VERSION: "0.0.0-sim",
+            PhilipsApi.DEVICE_ID: f"sim-{host}",
+            PhilipsApi.PRODUCT_ID: "sim",
+            PhilipsApi.WIFI_VERSION: "sim",
+            PhilipsApi.POWER: 1,
+            PhilipsApi.OPERATING_MODE: 0,
+            PhilipsApi.TARGET_TEMP: 21,
+            PhilipsApi.CHILD_LOCK: 0,
+            PhilipsApi.DISPLAY_BACKLIGHT: 1,
+            PhilipsApi.OSCILLATION: 0,
+            PhilipsApi.FAN_SPEED: 2,
+            PhilipsApi.HEATING_STATUS: 0,
+            PhilipsApi.TEMPERATURE: 0,
+        }
+        self._step()
+
+    def lost(self) -> bool:
+        """Return True if the next packet should be dropped."""
+        return self._random.random() < self.profile.packet_loss
+
+    def next_heartbeat(self) -> float:
+        """Return the delay until the next heartbeat."""
+        jitter = self.profile.heartbeat_jitter
+        return max(0.0, self.profile.heartbeat_interval + self._random.uniform(-jitter, jitter))
+
+    def apply(self, values: dict[str, Any]) -> None:
+        """Apply a control write and push the result to observers."""
+        self._step()
+        self.writes += 1
+        self.state.update(values)
+        if values.get(PhilipsApi.OSCILLATION) == 17222:
+            self.state[PhilipsApi.OSCILLATION] = 17920  # device reports running value
+        self._update_heating_status()
+        self.push("control")
+
+    def snapshot(self, status_type: str) -> dict[str, Any]:
+        """Return the current state as the device would push it."""
+        self._step()
+        self.pushes += 1
+        return {**self.state, PhilipsApi.STATUS_TYPE: status_type}
+
+    def push(self, status_type: str) -> None:
+        """Send the current state to every open observe stream."""
+        if not self.online:
+            return
+        status = self.snapshot(status_type)
+        for stream in self._streams:
+            stream.put_nowait(status)
+
+    def disconnect(self) -> None:
+        """End every open observe stream, as after a Wi-Fi drop."""
+        for stream in self._streams:
+            stream.put_nowait(None)
+
+    def set_online(self, online: bool) -> None:
+        """Take the heater off (or back onto) the network.
+
+        While offline, handshakes and writes fail and pushes stop silently,
+        which leaves observers waiting for their watchdog.
+        """
+        self.online = online
+
+    def open_stream(self) -> asyncio.Queue[dict[str, Any] | None]:
+        """Register an observe stream."""
+        stream: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+        self._streams.add(stream)
+        return stream
+
+    def close_stream(self, stream: asyncio.Queue[dict[str, Any] | None]) -> None:
+        """Unregister an observe stream."""
+        self._streams.discard(stream)
+
+    @property
+    def room_temp(self) -> float:
+        """Return the simulated room temperature."""
+        return self._room_temp
+
+    def _step(self) -> None:
+        """Advance the thermal model to now."""
+        now = time.monotonic()
+        hours = (now - self._last_step) * self.profile.time_scale / 3600
+        self._last_step = now
+        heating = self.state[PhilipsApi.HEATING_STATUS] if self.state[PhilipsApi.POWER] else 0
+        gain = HEAT_RATES.get(heating, 0.0)
+        loss = HEAT_LOSS_COEFFICIENT * (self._room_temp - self.profile.ambient_temp)
+        self._room_temp += (gain - loss) * hours
+        self.state[PhilipsApi.TEMPERATURE] = round(self._room_temp * 10)
+        self._update_heating_status()
+
+    def _update_heating_status(self) -> None:
+        """Derive HEATING_STATUS the way the firmware does."""
+        if not self.state[PhilipsApi.POWER]:
+            self.state[PhilipsApi.HEATING_STATUS] = 0
+            return
+        mode = self.state[PhilipsApi.OPERATING_MODE]
+        if mode == 0:
+            gap = self.state[PhilipsApi.TARGET_TEMP] - self._room_temp
+            if gap > 2:
+                status = 65
+            elif gap > 1:
+                status = 67
+            elif gap > 0:
+                status = 66
+            else:
+                status = -16
+        elif mode == -127:
+            status = 0
+        else:
+            status = mode
+        self.state[PhilipsApi.HEATING_STATUS] = status
+
+
+class SimulatedClient:
+    """Fake of aioairctrl's CoAPClient backed by a SimulatedHeater."""
+
+    def __init__(self, heater: SimulatedHeater) -> None:
+        """Initialize client."""
+        self.host = heater.host
+        self._heater = heater
+        self._closed = False
+
+    async def observe_status(self) -> AsyncIterator[dict[str, Any]]:
+        """Yield status pushes like CoAPClient.observe_status."""
+        heater = self._heater
+        profile = heater.profile
+        stream = heater.open_stream()
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        heartbeat: asyncio.TimerHandle | None = None
+
+        def _heartbeat() -> None:
+            nonlocal heartbeat
+            if heater.online:
+                stream.put_nowait(heater.snapshot("status"))
+            heartbeat = loop.call_later(heater.next_heartbeat(), _heartbeat)
+
+        heartbeat = loop.call_later(heater.next_heartbeat(), _heartbeat)
+        try:
+            while not self._closed:
+                timeout = None
+                if profile.disconnect_after is not None:
+                    timeout = max(0.0, started + profile.disconnect_after - loop.time())
+                try:
+                    status = await asyncio.wait_for(stream.get(), timeout)
+                except asyncio.TimeoutError:
+                    return
+                if status is None:
+                    return
+                if heater.lost():
+                    continue
+                await asyncio.sleep(profile.latency)
+                yield status
+        finally:
+            heartbeat.cancel()
+            heater.close_stream(stream)
+
+    async def set_control_value(self, key: str, value: Any) -> None:
+        """Write a single control value."""
+        await self.set_control_values({key: value})
+
+    async def set_control_values(self, data: dict[str, Any]) -> None:
+        """Write control values, subject to latency and loss."""
+        heater = self._heater
+        await asyncio.sleep(heater.profile.latency * 2)
+        if self._closed or not heater.online or heater.lost():
+            raise SimulatedNetworkError(f"Write to {self.host} lost")
+        heater.apply(data)
+
+    async def async_resync(self) -> None:
+        """Re-run the simulated key exchange."""
+        heater = self._heater
+        await asyncio.sleep(heater.profile.latency * 2)
+        if self._closed or not heater.online:
+            raise SimulatedNetworkError(f"Re-sync with {self.host} failed")
+
+    async def shutdown(self) -> None:
+        """Close the session."""
+        self._closed = True
+
+
+class SimulatedTransport:
+    """Drop-in for SharedCoAPTransport that connects to simulated heaters."""
+
+    def __init__(self, heaters: dict[str, SimulatedHeater]) -> None:
+        """Initialize transport over host -> heater mapping."""
+        self.heaters = heaters
+        self.handshakes = 0
+        self.scheduler = ConnectionScheduler(HANDSHAKE_CONCURRENCY)
+        self.probe_scheduler = ConnectionScheduler(PROBE_CONCURRENCY)
+
+    async def async_create_client(
+        self, host: str, priority: float = 0.0, timeout: float | None = None
+    ) -> SimulatedClient:
+        """Perform a simulated handshake with host."""
+        heater = self.heaters.get(host)
+        if heater is None:
+            raise SimulatedNetworkError(f"No simulated heater at {host}")
+        async with self._scheduler_for(priority).async_slot(priority):
+            # sync request + key exchange
+            await asyncio.wait_for(asyncio.sleep(heater.profile.latency * 4), timeout)
+        self.handshakes += 1
+        if not heater.online or heater._random.random() < heater.profile.connect_failure_rate:
+            raise SimulatedNetworkError(f"Handshake with {host} failed")
+        return SimulatedClient(heater)
+
+    async def async_resync(
+        self, client: SimulatedClient, priority: float = 0.0, timeout: float | None = None
+    ) -> None:
+        """Re-run a client's simulated key exchange within the handshake limit."""
+        async with self._scheduler_for(priority).async_slot(priority):
+            await asyncio.wait_for(client.async_resync(), timeout)
+
+    def _scheduler_for(self, priority: float) -> ConnectionScheduler:
+        """Pick the probe pool or the fleet scheduler like the real transport."""
+        if priority == HANDSHAKE_PRIORITY_INTERACTIVE:
+            return self.probe_scheduler
+        return self.scheduler
+
+    def acquire(self) -> None:
+        """Register a user of the transport."""
+
+    async def async_release(self) -> bool:
+        """Unregister a user of the transport."""
+        return False
+
+
+def build_fleet(
+    count: int, profile: SimulatorProfile | None = None, seed: int = 0
+) -> dict[str, SimulatedHeater]:
+    """Create count heaters on 10.0.x.y addresses."""
+    heaters = {}
+    for index in range(count):
+        host = f"10.0.{index // 250}.{index % 250 + 1}"
+        model = "CX5120" if index % 2 == 0 else "CX3120"
+        heaters[host] = SimulatedHeater(host, model, profile, seed=seed + index)
+    return heaters
+
+
+async def _async_watch(transport: SimulatedTransport, host: str, duration: float) -> None:
+    """Print pushes from one heater until duration elapses."""
+    client = await transport.async_create_client(host)
+    try:
+        async with asyncio.timeout(duration):
+            async for status in client.observe_status():
+                print(
+                    f"{host} [{status[PhilipsApi.STATUS_TYPE]}]"
+                    f" temp={status[PhilipsApi.TEMPERATURE] / 10:.1f}"
+                    f" heating={status[PhilipsApi.HEATING_STATUS]}"
+                )
+    except TimeoutError:
+        pass
+    finally:
+        await client.shutdown()
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    """Run the simulator from the command line."""
+    profile = SimulatorProfile(
+        heartbeat_interval=args.heartbeat,
+        packet_loss=args.loss,
+        time_scale=args.time_scale,
+    )
+    transport = SimulatedTransport(build_fleet(args.heaters, profile))
+    await asyncio.gather(
+        *(_async_watch(transport, host, args.duration) for host in transport.heaters)
+    )
+
+
+def main() -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--heaters", type=int, default=1)
+    parser.add_argument("--duration", type=float, default=60)
+    parser.add_argument("--heartbeat", type=float, default=20)
+    parser.add_argument("--loss", type=float, default=0.0)
+    parser.add_argument("--time-scale", type=float, default=60)
+    asyncio.run(_async_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()